@@ -414,7 +414,6 @@ class MainWindow(FluentWindow):
         """
         import os
         from datetime import datetime
-        import csv
         
         # 生成默认文件名
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -429,12 +428,8 @@ class MainWindow(FluentWindow):
                 # 确保目录存在
                 os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
                 
-                articles = self.results_page.articles
-                with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-                    if articles:
-                        writer = csv.DictWriter(f, fieldnames=articles[0].keys())
-                        writer.writeheader()
-                        writer.writerows(articles)
+                # 与结果页导出 CSV 共用同一写入路径（数据量大时同样分段保存）
+                self.results_page.save_csv(file_path)
                 
                 # 保存成功，退出
                 self.results_page.is_unsaved = False
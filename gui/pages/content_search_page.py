@@ -21,6 +21,7 @@
     - 通配符转正则表达式
     - URL 模式特殊处理（限制匹配字符范围）
     - 智能 URL 清理（移除末尾非法字符）
+    - 文件加载与正则扫描在线程池中执行，不阻塞界面
     - 紧凑单屏布局设计
 """
 
@@ -28,13 +29,16 @@ import re
 import os
 import csv
 import json
+import mmap
+import heapq
+import functools
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QHeaderView,
     QFileDialog, QTableWidgetItem, QAbstractItemView, QMenu,
     QSplitter
 )
-from PyQt6.QtCore import Qt, QUrl
+from PyQt6.QtCore import Qt, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QDesktopServices, QAction
 
 from qfluentwidgets import (
@@ -46,8 +50,19 @@ from qfluentwidgets import (
 from qfluentwidgets import TableWidget as FluentTable
 
 from ..styles import COLORS
+from ..utils import FILENAME_BAD_CHARS
 
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# URL 模式下通配符允许匹配的字符集
+_URL_CHARS = r'[A-Za-z0-9_\-\.~:/?#\[\]@!$&\'()+,;=%]'
+
+
+@functools.lru_cache(maxsize=32)
 def wildcard_to_regex(pattern, is_url_pattern=False):
     """
     将通配符模式转换为正则表达式
@@ -67,6 +82,8 @@ def wildcard_to_regex(pattern, is_url_pattern=False):
     Returns:
         re.Pattern: 编译后的正则表达式对象（忽略大小写）
     
+    同一模式的转换结果会被缓存，重复搜索（如快捷按钮）无需重新解析。
+    
     Examples:
         >>> regex = wildcard_to_regex("https://pan.quark.cn/s/*", is_url_pattern=True)
         >>> regex.search("链接: https://pan.quark.cn/s/abc123")
@@ -76,12 +93,12 @@ def wildcard_to_regex(pattern, is_url_pattern=False):
         if char == '*':
             if is_url_pattern:
                 # URL模式：只匹配URL合法字符（不包括空格、换行、*、中文等）
-                regex_pattern += r'[A-Za-z0-9_\-\.~:/?#\[\]@!$&\'()+,;=%]*'
+                regex_pattern += _URL_CHARS + '*'
             else:
                 regex_pattern += '.*'
         elif char == '?':
             if is_url_pattern:
-                regex_pattern += r'[A-Za-z0-9_\-\.~:/?#\[\]@!$&\'()+,;=%]'
+                regex_pattern += _URL_CHARS
             else:
                 regex_pattern += '.'
         elif char in r'\[](){}|^$+.':
@@ -148,6 +165,215 @@ def clean_url(url):
     return url
 
 
+def _load_csv(file_path):
+    """加载CSV文件"""
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+
+def _load_json(file_path):
+    """
+    加载JSON文件
+    
+    安装了 orjson 时将文件只读映射后直接交给 orjson 解析，
+    不再先把整个文件读成 Python 字符串。
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = orjson.loads(memoryview(mm))
+        else:
+            data = json.loads(f.read().decode('utf-8'))
+    if not isinstance(data, list):
+        raise ValueError("JSON文件格式不正确，应为文章列表")
+    return data
+
+
+def _load_markdown(file_path):
+    """
+    加载 Markdown 文件
+    
+    将整个 MD 文件作为一篇文章处理。
+    
+    Args:
+        file_path: Markdown 文件路径
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # 将整个MD文件作为一篇文章处理
+    filename = os.path.basename(file_path)
+    title = os.path.splitext(filename)[0]
+    
+    return [{
+        '公众号': '',
+        '标题': title,
+        '内容': content,
+        '发布时间': '',
+        '链接': ''
+    }]
+
+
+def load_articles(file_path):
+    """
+    加载数据文件
+    
+    Args:
+        file_path: CSV/JSON/MD 文件路径
+        
+    Returns:
+        tuple: (文章列表, 与之按位置对应的正文列表)
+        
+    Raises:
+        ValueError: 文件格式不支持或内容格式不正确
+    """
+    if file_path.endswith('.csv'):
+        articles = _load_csv(file_path)
+    elif file_path.endswith('.json'):
+        articles = _load_json(file_path)
+    elif file_path.endswith('.md'):
+        articles = _load_markdown(file_path)
+    else:
+        raise ValueError("不支持的文件格式，支持: CSV, JSON, MD")
+    
+    # 一次性提取正文，搜索时直接按位置遍历，避免每次搜索重复做两次字典查找
+    contents = [
+        article.get('内容', '') or article.get('content', '')
+        for article in articles
+    ]
+    return articles, contents
+
+
+def search_articles(articles, contents, regex, is_url_pattern, progress_callback=None):
+    """
+    在文章正文中搜索匹配内容
+    
+    Args:
+        articles: 文章列表
+        contents: 与 articles 按位置对应的正文列表
+        regex: 编译后的正则表达式
+        is_url_pattern: 是否为 URL 模式
+        progress_callback: 进度回调，参数为百分比 (0-100)
+        
+    Returns:
+        list: 搜索结果，元素为 {'article', 'matches', 'match_count'}
+    """
+    results = []
+    total = len(contents)
+    last_percent = -1
+    
+    for i, content in enumerate(contents):
+        if progress_callback is not None:
+            percent = i * 100 // total
+            if percent != last_percent:
+                last_percent = percent
+                progress_callback(percent)
+        
+        if not content:
+            continue
+        article = articles[i]
+        
+        if is_url_pattern:
+            # URL模式：使用专门的URL提取函数
+            url_matches = extract_urls_from_text(content, regex)
+            if url_matches:
+                match_contexts = []
+                for url in url_matches:
+                    match_contexts.append({
+                        'match': url,
+                        'context': url
+                    })
+                
+                results.append({
+                    'article': article,
+                    'matches': match_contexts,
+                    'match_count': len(url_matches)
+                })
+        else:
+            # 普通模式
+            matches = regex.findall(content)
+            if matches:
+                match_contexts = []
+                for match in regex.finditer(content):
+                    match_contexts.append({
+                        'match': match.group(),
+                        'context': match.group()
+                    })
+                
+                results.append({
+                    'article': article,
+                    'matches': match_contexts,
+                    'match_count': len(matches)
+                })
+    
+    return results
+
+
+class _WorkerSignals(QObject):
+    """
+    后台任务信号
+    
+    QRunnable 不是 QObject，无法直接定义信号，由该对象代为发射。
+    
+    Signals:
+        finished(object): 任务完成，参数为任务结果
+        failed(str): 任务失败，参数为错误消息
+        progress(int): 进度百分比
+    """
+    
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+
+class _LoadWorker(QRunnable):
+    """
+    数据文件加载任务
+    
+    在线程池中读取并解析数据文件，完成后发射 (文件路径, 文章列表, 正文列表)。
+    """
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = _WorkerSignals()
+    
+    def run(self):
+        try:
+            articles, contents = load_articles(self.file_path)
+            self.signals.finished.emit((self.file_path, articles, contents))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class _SearchWorker(QRunnable):
+    """
+    内容搜索任务
+    
+    在线程池中执行正则扫描，完成后发射 (搜索结果, 唯一匹配集合)。
+    """
+    
+    def __init__(self, articles, contents, regex, is_url_pattern):
+        super().__init__()
+        self.articles = articles
+        self.contents = contents
+        self.regex = regex
+        self.is_url_pattern = is_url_pattern
+        self.signals = _WorkerSignals()
+    
+    def run(self):
+        try:
+            results = search_articles(
+                self.articles, self.contents, self.regex,
+                self.is_url_pattern, self.signals.progress.emit
+            )
+            # 导出TXT时直接使用，无需再遍历一次结果
+            unique_matches = {m['match'] for r in results for m in r['matches']}
+            self.signals.finished.emit((results, unique_matches))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
 class ContentSearchPage(QWidget):
     """
     内容搜索页面
@@ -171,6 +397,7 @@ class ContentSearchPage(QWidget):
     Attributes:
         articles: 加载的文章数据列表
         search_results: 搜索结果列表
+        _contents: 与 articles 按位置对应的文章正文列表（加载时构建一次）
         current_file: 当前加载的文件路径
     """
     
@@ -183,8 +410,12 @@ class ContentSearchPage(QWidget):
         """
         super().__init__(parent)
         self.articles = []
+        self._contents = []
         self.search_results = []
+        self._unique_matches = set()
         self.current_file = None
+        self._load_worker = None
+        self._search_worker = None
         self.setObjectName("contentSearchPage")
         self._setup_ui()
         self._apply_dark_background()
@@ -253,10 +484,10 @@ class ContentSearchPage(QWidget):
         self.recent_combo.currentIndexChanged.connect(self._on_combo_changed)
         source_layout.addWidget(self.recent_combo)
         
-        browse_btn = PushButton("浏览")
-        browse_btn.setFixedWidth(60)
-        browse_btn.clicked.connect(self._on_browse_file)
-        source_layout.addWidget(browse_btn)
+        self.browse_btn = PushButton("浏览")
+        self.browse_btn.setFixedWidth(60)
+        self.browse_btn.clicked.connect(self._on_browse_file)
+        source_layout.addWidget(self.browse_btn)
         
         source_layout.addSpacing(10)
         
@@ -281,10 +512,10 @@ class ContentSearchPage(QWidget):
         self.search_input.returnPressed.connect(self._on_search)
         search_layout.addWidget(self.search_input)
         
-        search_btn = PrimaryPushButton("搜索")
-        search_btn.setFixedWidth(70)
-        search_btn.clicked.connect(self._on_search)
-        search_layout.addWidget(search_btn)
+        self.search_btn = PrimaryPushButton("搜索")
+        self.search_btn.setFixedWidth(70)
+        self.search_btn.clicked.connect(self._on_search)
+        search_layout.addWidget(self.search_btn)
         
         control_layout.addLayout(search_layout)
         
@@ -305,11 +536,13 @@ class ContentSearchPage(QWidget):
             ("迅雷", "https://pan.xunlei.com/s/*"),
         ]
         
+        self.preset_buttons = []
         for name, pattern in presets:
             btn = PushButton(name)
             btn.setFixedWidth(55)
             btn.clicked.connect(lambda checked, p=pattern: self._set_search_pattern(p))
             preset_layout.addWidget(btn)
+            self.preset_buttons.append(btn)
         
         preset_layout.addStretch()
         control_layout.addLayout(preset_layout)
@@ -365,9 +598,8 @@ class ContentSearchPage(QWidget):
             files = []
             self._scan_files_recursive(results_dir, files)
             
-            files.sort(key=lambda x: x[2], reverse=True)
-            
-            for name, path, _ in files[:30]:
+            # 只需要最新的30个，部分选择即可，无需全量排序
+            for name, path, _ in heapq.nlargest(30, files, key=lambda x: x[2]):
                 # 显示相对路径
                 rel_path = os.path.relpath(path, results_dir)
                 self.recent_combo.addItem(rel_path, userData=path)
@@ -413,87 +645,91 @@ class ContentSearchPage(QWidget):
         if file_path:
             self._load_data_file(file_path)
     
-    def _load_data_file(self, file_path):
-        """加载数据文件"""
-        try:
-            self.articles = []
-            
-            if file_path.endswith('.csv'):
-                self._load_csv(file_path)
-            elif file_path.endswith('.json'):
-                self._load_json(file_path)
-            elif file_path.endswith('.md'):
-                self._load_markdown(file_path)
-            else:
-                raise ValueError("不支持的文件格式，支持: CSV, JSON, MD")
-            
-            self.current_file = file_path
-            self.data_status_label.setText(f"已加载 {len(self.articles)} 篇")
-            self.data_status_label.setStyleSheet(f"color: {COLORS['success']};")
-            
-            # 清空搜索结果
-            self.search_results = []
-            self.result_table.setRowCount(0)
-            self.result_count_label.setText("搜索结果: 0 条匹配")
-            self.export_btn.setEnabled(False)
-            
-            InfoBar.success(
-                title="加载成功", 
-                content=f"成功加载 {len(self.articles)} 篇文章", 
-                parent=self, 
-                position=InfoBarPosition.TOP, 
-                duration=2000
-            )
-        except Exception as e:
-            self.data_status_label.setText("加载失败")
-            self.data_status_label.setStyleSheet(f"color: {COLORS['error']};")
-            InfoBar.error(
-                title="加载失败", 
-                content=str(e), 
-                parent=self, 
-                position=InfoBarPosition.TOP, 
-                duration=3000
-            )
-    
-    def _load_csv(self, file_path):
-        """加载CSV文件"""
-        with open(file_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                self.articles.append(row)
-    
-    def _load_json(self, file_path):
-        """加载JSON文件"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                self.articles = data
-            else:
-                raise ValueError("JSON文件格式不正确，应为文章列表")
+    def _set_busy(self, busy):
+        """
+        设置后台任务进行中的界面状态
+        
+        加载或搜索期间禁用数据源和搜索相关控件，避免并发任务互相覆盖结果。
+        
+        Args:
+            busy: 是否有后台任务进行中
+        """
+        enabled = not busy
+        self.recent_combo.setEnabled(enabled)
+        self.browse_btn.setEnabled(enabled)
+        self.search_input.setEnabled(enabled)
+        self.search_btn.setEnabled(enabled)
+        for btn in self.preset_buttons:
+            btn.setEnabled(enabled)
+        self.export_btn.setEnabled(enabled and len(self.search_results) > 0)
     
-    def _load_markdown(self, file_path):
+    def _load_data_file(self, file_path):
         """
-        加载 Markdown 文件
+        加载数据文件
         
-        将整个 MD 文件作为一篇文章处理。
+        文件读取和解析在线程池中执行，完成后回到主线程更新界面。
         
         Args:
-            file_path: Markdown 文件路径
+            file_path: 数据文件路径
+        """
+        self.data_status_label.setText("加载中...")
+        self.data_status_label.setStyleSheet(f"color: {COLORS['text_secondary']};")
+        self._set_busy(True)
+        
+        worker = _LoadWorker(file_path)
+        worker.signals.finished.connect(self._on_load_finished)
+        worker.signals.failed.connect(self._on_load_failed)
+        # 保持引用，确保信号对象在任务结束前不被回收
+        self._load_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_load_finished(self, result):
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        数据文件加载完成
         
-        # 将整个MD文件作为一篇文章处理
-        filename = os.path.basename(file_path)
-        title = os.path.splitext(filename)[0]
+        Args:
+            result: (文件路径, 文章列表, 正文列表)
+        """
+        self._load_worker = None
+        self.current_file, self.articles, self._contents = result
+        self.data_status_label.setText(f"已加载 {len(self.articles)} 篇")
+        self.data_status_label.setStyleSheet(f"color: {COLORS['success']};")
+        
+        # 清空搜索结果
+        self.search_results = []
+        self._unique_matches = set()
+        self.result_table.setRowCount(0)
+        self.result_count_label.setText("搜索结果: 0 条匹配")
+        self._set_busy(False)
         
-        self.articles.append({
-            '公众号': '',
-            '标题': title,
-            '内容': content,
-            '发布时间': '',
-            '链接': ''
-        })
+        InfoBar.success(
+            title="加载成功", 
+            content=f"成功加载 {len(self.articles)} 篇文章", 
+            parent=self, 
+            position=InfoBarPosition.TOP, 
+            duration=2000
+        )
+    
+    def _on_load_failed(self, error):
+        """
+        数据文件加载失败
+        
+        Args:
+            error: 错误消息
+        """
+        self._load_worker = None
+        self.articles = []
+        self._contents = []
+        self.data_status_label.setText("加载失败")
+        self.data_status_label.setStyleSheet(f"color: {COLORS['error']};")
+        self._set_busy(False)
+        InfoBar.error(
+            title="加载失败", 
+            content=error, 
+            parent=self, 
+            position=InfoBarPosition.TOP, 
+            duration=3000
+        )
     
     def _set_search_pattern(self, pattern):
         """设置搜索模式并自动搜索"""
@@ -504,7 +740,11 @@ class ContentSearchPage(QWidget):
             self.search_input.setFocus()
     
     def _on_search(self):
-        """执行搜索"""
+        """
+        执行搜索
+        
+        正则扫描在线程池中执行，期间禁用搜索控件并显示进度。
+        """
         if not self.articles:
             InfoBar.warning(
                 title="提示",
@@ -530,75 +770,82 @@ class ContentSearchPage(QWidget):
             # 判断是否为URL模式
             is_url_pattern = pattern.startswith('http://') or pattern.startswith('https://')
             regex = wildcard_to_regex(pattern, is_url_pattern)
-            
-            self.search_results = []
-            for article in self.articles:
-                content = article.get('内容', '') or article.get('content', '')
-                if not content:
-                    continue
-                
-                if is_url_pattern:
-                    # URL模式：使用专门的URL提取函数
-                    url_matches = extract_urls_from_text(content, regex)
-                    if url_matches:
-                        match_contexts = []
-                        for url in url_matches:
-                            match_contexts.append({
-                                'match': url,
-                                'context': url
-                            })
-                        
-                        self.search_results.append({
-                            'article': article,
-                            'matches': match_contexts,
-                            'match_count': len(url_matches)
-                        })
-                else:
-                    # 普通模式
-                    matches = regex.findall(content)
-                    if matches:
-                        match_contexts = []
-                        for match in regex.finditer(content):
-                            match_contexts.append({
-                                'match': match.group(),
-                                'context': match.group()
-                            })
-                        
-                        self.search_results.append({
-                            'article': article,
-                            'matches': match_contexts,
-                            'match_count': len(matches)
-                        })
-            
-            self._display_results()
-            
-            if self.search_results:
-                total_matches = sum(r['match_count'] for r in self.search_results)
-                InfoBar.success(
-                    title="搜索完成",
-                    content=f"在 {len(self.search_results)} 篇文章中找到 {total_matches} 处匹配",
-                    parent=self,
-                    position=InfoBarPosition.TOP,
-                    duration=2000
-                )
-            else:
-                InfoBar.info(
-                    title="搜索完成",
-                    content="未找到匹配内容",
-                    parent=self,
-                    position=InfoBarPosition.TOP,
-                    duration=2000
-                )
-                
         except Exception as e:
-            InfoBar.error(
-                title="搜索失败",
-                content=str(e),
+            self._on_search_failed(str(e))
+            return
+        
+        self._set_busy(True)
+        self.result_count_label.setText("搜索中...")
+        
+        worker = _SearchWorker(self.articles, self._contents, regex, is_url_pattern)
+        worker.signals.progress.connect(self._on_search_progress)
+        worker.signals.finished.connect(self._on_search_finished)
+        worker.signals.failed.connect(self._on_search_failed)
+        # 保持引用，确保信号对象在任务结束前不被回收
+        self._search_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_search_progress(self, percent):
+        """
+        更新搜索进度
+        
+        Args:
+            percent: 进度百分比
+        """
+        self.result_count_label.setText(f"搜索中... {percent}%")
+    
+    def _on_search_finished(self, result):
+        """
+        搜索完成
+        
+        Args:
+            result: (搜索结果列表, 唯一匹配集合)
+        """
+        self._search_worker = None
+        self.search_results, self._unique_matches = result
+        self._set_busy(False)
+        self._display_results()
+        
+        if self.search_results:
+            total_matches = sum(r['match_count'] for r in self.search_results)
+            InfoBar.success(
+                title="搜索完成",
+                content=f"在 {len(self.search_results)} 篇文章中找到 {total_matches} 处匹配",
                 parent=self,
                 position=InfoBarPosition.TOP,
-                duration=3000
+                duration=2000
+            )
+        else:
+            InfoBar.info(
+                title="搜索完成",
+                content="未找到匹配内容",
+                parent=self,
+                position=InfoBarPosition.TOP,
+                duration=2000
             )
     
+    def _on_search_failed(self, error):
+        """
+        搜索失败
+        
+        Args:
+            error: 错误消息
+        """
+        self._search_worker = None
+        # 清空上一次的搜索结果，使表格、计数和导出按钮与提示一致
+        self.search_results = []
+        self._unique_matches = set()
+        self.result_table.setRowCount(0)
+        self.result_count_label.setText("搜索结果: 0 条匹配")
+        self._set_busy(False)
+        InfoBar.error(
+            title="搜索失败",
+            content=error,
+            parent=self,
+            position=InfoBarPosition.TOP,
+            duration=3000
+        )
+    
     def _display_results(self):
         """显示搜索结果"""
         self.result_table.setRowCount(0)
@@ -719,7 +966,7 @@ class ContentSearchPage(QWidget):
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         pattern = self.search_input.text().strip()
-        safe_pattern = "".join(c for c in pattern if c not in r'\/:*?"<>|')[:30]
+        safe_pattern = pattern.translate(FILENAME_BAD_CHARS)[:30]
         default_name = f"results/搜索结果_{safe_pattern}_{timestamp}.txt"
         
         file_path, _ = QFileDialog.getSaveFileName(
@@ -766,10 +1013,7 @@ class ContentSearchPage(QWidget):
         Args:
             file_path: 保存路径
         """
-        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['公众号', '标题', '匹配内容', '发布时间', '文章链接'])
-            
+        def rows():
             for result in self.search_results:
                 article = result['article']
                 account = article.get('公众号', '') or article.get('name', '')
@@ -778,7 +1022,13 @@ class ContentSearchPage(QWidget):
                 link = article.get('链接', '') or article.get('link', '')
                 
                 for match_info in result['matches']:
-                    writer.writerow([account, title, match_info['match'], pub_time, link])
+                    yield (account, title, match_info['match'], pub_time, link)
+        
+        # 1MB 写缓冲，配合 writerows 批量落盘
+        with open(file_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(['公众号', '标题', '匹配内容', '发布时间', '文章链接'])
+            writer.writerows(rows())
     
     def _export_as_json(self, file_path):
         """导出为JSON"""
@@ -794,8 +1044,12 @@ class ContentSearchPage(QWidget):
                 '匹配数量': result['match_count']
             })
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, ensure_ascii=False, indent=2)
     
     def _export_as_txt(self, file_path):
         """导出为纯文本（仅匹配内容）"""
@@ -805,13 +1059,9 @@ class ContentSearchPage(QWidget):
             f.write(f"匹配文章数: {len(self.search_results)}\n")
             f.write("=" * 50 + "\n\n")
             
-            unique_matches = set()
-            for result in self.search_results:
-                for match_info in result['matches']:
-                    unique_matches.add(match_info['match'])
-            
+            unique_matches = self._unique_matches
             f.write(f"唯一匹配内容 ({len(unique_matches)} 条):\n")
             f.write("-" * 30 + "\n")
-            for match in sorted(unique_matches):
-                f.write(f"{match}\n")
+            if unique_matches:
+                f.write('\n'.join(sorted(unique_matches)) + '\n')
     
\ No newline at end of file
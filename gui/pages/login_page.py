@@ -17,13 +17,14 @@
 页面结构:
     使用 QStackedWidget 在两个视图间切换：
     - 状态视图: 显示登录状态和操作按钮
-    - 浏览器视图: 内嵌浏览器进行扫码登录
+    - 浏览器视图: 内嵌浏览器进行扫码登录（首次登录时创建，登录成功后释放）
 
 自定义组件:
     - StatusIndicator: 带发光效果的状态指示灯
     - CookieCollector: Cookie 收集器，监听浏览器 Cookie
     - CustomWebEnginePage: 自定义页面，拦截新窗口请求
     - ImportCredentialDialog: 凭证导入对话框
+    - _CodecWorker: 凭证编解码后台任务，避免文件读写阻塞界面
 
 登录流程:
     1. 用户点击"扫码登录"按钮
@@ -39,14 +40,19 @@
 """
 
 import re
+import math
+import time
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFrame, QStackedWidget,
     QDialog, QTextEdit, QApplication
 )
-from PyQt6.QtCore import pyqtSignal, QUrl, QTimer, Qt, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QRadialGradient
+from PyQt6.QtCore import (
+    pyqtSignal, QUrl, QTimer, Qt, QPointF, QRect,
+    QObject, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QRadialGradient, QClipboard
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage
+from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings
 
 from qfluentwidgets import (
     ScrollArea, TitleLabel, BodyLabel, CaptionLabel, SubtitleLabel,
@@ -65,6 +71,10 @@ from spider.wechat.cache_codec import (
 )
 
 
+# 登录成功后 URL 中携带的 token 参数（匹配编码后的 URL 字节串）
+_TOKEN_RE = re.compile(rb'token=(\d+)')
+
+
 class StatusIndicator(QWidget):
     """美观的状态指示器 - 带发光效果的圆形指示灯"""
     
@@ -75,155 +85,206 @@ class StatusIndicator(QWidget):
         self._glow_opacity = 0.0
         self._pulse_scale = 1.0
         
-        # 发光动画
-        self._glow_animation = QPropertyAnimation(self, b"glowOpacity")
-        self._glow_animation.setDuration(1500)
-        self._glow_animation.setLoopCount(-1)  # 无限循环
-        self._glow_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        # 发光/脉冲动画：单个定时器 (~30 Hz) 由同一相位同时驱动两个值
+        self._phase_timer = QTimer(self)
+        self._phase_timer.setInterval(33)
+        self._phase_timer.timeout.connect(self._tick)
         
-        # 脉冲动画
-        self._pulse_animation = QPropertyAnimation(self, b"pulseScale")
-        self._pulse_animation.setDuration(1500)
-        self._pulse_animation.setLoopCount(-1)
-        self._pulse_animation.setEasingCurve(QEasingCurve.Type.InOutSine)
+        self._build_paint_cache()
     
-    def get_glow_opacity(self):
-        return self._glow_opacity
-    
-    def set_glow_opacity(self, value):
-        self._glow_opacity = value
-        self.update()
+    def _build_paint_cache(self):
+        """
+        预先构建绘制用的画刷、画笔和坐标
+        
+        除外层发光外，各层的渐变和颜色都是固定的，只在尺寸变化时重建，
+        避免每帧重复创建渐变、颜色和画刷对象。
+        """
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        self._center = QPointF(center_x, center_y)
+        
+        def circle_rect(cx, cy, radius):
+            return QRect(int(cx - radius), int(cy - radius),
+                         int(radius * 2), int(radius * 2))
+        
+        # 已登录 - 绿色发光效果
+        base_color = QColor("#07C160")  # 微信绿
+        
+        # 外层发光：半径和透明度随动画变化，只复用渐变对象和颜色
+        self._glow_color = QColor(base_color)
+        self._glow_edge_color = QColor(base_color)
+        self._glow_edge_color.setAlphaF(0)
+        self._glow_gradient = QRadialGradient(center_x, center_y, 12)
+        
+        # 中间光晕
+        mid_radius = 8
+        mid_gradient = QRadialGradient(center_x, center_y, mid_radius)
+        mid_color = QColor(base_color)
+        mid_color.setAlphaF(0.3)
+        mid_gradient.setColorAt(0, mid_color)
+        mid_color.setAlphaF(0.1)
+        mid_gradient.setColorAt(1, mid_color)
+        self._mid_brush = QBrush(mid_gradient)
+        self._mid_rect = circle_rect(center_x, center_y, mid_radius)
+        
+        # 核心圆点
+        core_radius = 5
+        core_gradient = QRadialGradient(center_x - 1, center_y - 1, core_radius)
+        core_gradient.setColorAt(0, QColor("#4ADE80"))  # 亮绿
+        core_gradient.setColorAt(0.7, base_color)
+        core_gradient.setColorAt(1, QColor("#059669"))  # 深绿
+        self._core_brush = QBrush(core_gradient)
+        self._core_pen = QPen(QColor("#059669"), 1)
+        self._core_rect = circle_rect(center_x, center_y, core_radius)
+        
+        # 高光点
+        highlight_radius = 1.5
+        self._highlight_brush = QBrush(QColor(255, 255, 255, 180))
+        self._highlight_rect = QRect(int(center_x - 2), int(center_y - 2),
+                                     int(highlight_radius * 2), int(highlight_radius * 2))
+        
+        # 未登录 - 灰色暗淡效果
+        outer_radius = 8
+        self._inactive_outer_brush = QBrush(QColor(60, 60, 60, 100))
+        self._inactive_outer_pen = QPen(QColor(80, 80, 80), 1)
+        self._inactive_outer_rect = circle_rect(center_x, center_y, outer_radius)
+        
+        inactive_core_radius = 4
+        inactive_gradient = QRadialGradient(center_x - 0.5, center_y - 0.5, inactive_core_radius)
+        inactive_gradient.setColorAt(0, QColor("#9CA3AF"))  # 浅灰
+        inactive_gradient.setColorAt(0.5, QColor("#6B7280"))  # 中灰
+        inactive_gradient.setColorAt(1, QColor("#4B5563"))  # 深灰
+        self._inactive_core_brush = QBrush(inactive_gradient)
+        self._inactive_core_pen = QPen(QColor("#4B5563"), 0.5)
+        self._inactive_core_rect = circle_rect(center_x, center_y, inactive_core_radius)
     
-    def get_pulse_scale(self):
-        return self._pulse_scale
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._build_paint_cache()
     
-    def set_pulse_scale(self, value):
-        self._pulse_scale = value
+    def _tick(self):
+        """
+        动画帧：按 1.5 秒周期计算发光透明度和脉冲缩放
+        
+        透明度按 0.02 取整，缩放按发光半径 (12 * scale) 的 0.5 像素取整，
+        两者都未变化时不触发重绘。
+        """
+        phase = math.sin(time.monotonic() * (2 * math.pi / 1.5))
+        glow_opacity = round((0.55 + 0.25 * phase) * 50) / 50
+        pulse_scale = round((1.0 + 0.1 * phase) * 24) / 24
+        if glow_opacity == self._glow_opacity and pulse_scale == self._pulse_scale:
+            return
+        self._glow_opacity = glow_opacity
+        self._pulse_scale = pulse_scale
         self.update()
     
-    glowOpacity = pyqtProperty(float, get_glow_opacity, set_glow_opacity)
-    pulseScale = pyqtProperty(float, get_pulse_scale, set_pulse_scale)
-    
     def setActive(self, active: bool):
         """设置激活状态"""
         self._is_active = active
         
-        if active:
-            # 启动动画
-            self._glow_animation.setStartValue(0.3)
-            self._glow_animation.setEndValue(0.8)
-            self._glow_animation.start()
-            
-            self._pulse_animation.setStartValue(0.9)
-            self._pulse_animation.setEndValue(1.1)
-            self._pulse_animation.start()
-        else:
-            # 停止动画
-            self._glow_animation.stop()
-            self._pulse_animation.stop()
+        if not active:
             self._glow_opacity = 0.0
             self._pulse_scale = 1.0
         
+        self._sync_animations()
         self.update()
     
+    def _sync_animations(self):
+        """
+        根据激活状态和可见性启停动画
+        
+        只有处于激活状态且控件可见时才运行动画，
+        页面切走、窗口最小化时停止，避免无意义的重绘。
+        """
+        should_run = self._is_active and self.isVisible()
+        running = self._phase_timer.isActive()
+        
+        if should_run and not running:
+            self._tick()
+            self._phase_timer.start()
+        elif not should_run and running:
+            self._phase_timer.stop()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_animations()
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_animations()
+    
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        center_x = self.width() / 2
-        center_y = self.height() / 2
+        # 动画期间每帧都会调用，先把常用属性和方法绑定到局部变量
+        set_brush = painter.setBrush
+        set_pen = painter.setPen
+        draw_ellipse = painter.drawEllipse
+        no_pen = Qt.PenStyle.NoPen
         
         if self._is_active:
-            # 已登录 - 绿色发光效果
-            base_color = QColor("#07C160")  # 微信绿
-            
             # 外层发光
-            if self._glow_opacity > 0:
+            glow_opacity = self._glow_opacity
+            if glow_opacity > 0:
                 glow_radius = 12 * self._pulse_scale
-                glow_gradient = QRadialGradient(center_x, center_y, glow_radius)
-                glow_color = QColor(base_color)
-                glow_color.setAlphaF(self._glow_opacity * 0.4)
-                glow_gradient.setColorAt(0, glow_color)
-                glow_color.setAlphaF(0)
-                glow_gradient.setColorAt(1, glow_color)
-                painter.setBrush(QBrush(glow_gradient))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(int(center_x - glow_radius), int(center_y - glow_radius),
-                                   int(glow_radius * 2), int(glow_radius * 2))
+                glow_gradient = self._glow_gradient
+                glow_gradient.setRadius(glow_radius)
+                glow_color = self._glow_color
+                glow_color.setAlphaF(glow_opacity * 0.4)
+                glow_gradient.setStops([(0, glow_color), (1, self._glow_edge_color)])
+                set_brush(QBrush(glow_gradient))
+                set_pen(no_pen)
+                draw_ellipse(self._center, glow_radius, glow_radius)
             
             # 中间光晕
-            mid_radius = 8
-            mid_gradient = QRadialGradient(center_x, center_y, mid_radius)
-            mid_color = QColor(base_color)
-            mid_color.setAlphaF(0.3)
-            mid_gradient.setColorAt(0, mid_color)
-            mid_color.setAlphaF(0.1)
-            mid_gradient.setColorAt(1, mid_color)
-            painter.setBrush(QBrush(mid_gradient))
-            painter.drawEllipse(int(center_x - mid_radius), int(center_y - mid_radius),
-                               int(mid_radius * 2), int(mid_radius * 2))
+            set_brush(self._mid_brush)
+            set_pen(no_pen)
+            draw_ellipse(self._mid_rect)
             
             # 核心圆点
-            core_radius = 5
-            core_gradient = QRadialGradient(center_x - 1, center_y - 1, core_radius)
-            core_gradient.setColorAt(0, QColor("#4ADE80"))  # 亮绿
-            core_gradient.setColorAt(0.7, base_color)
-            core_gradient.setColorAt(1, QColor("#059669"))  # 深绿
-            painter.setBrush(QBrush(core_gradient))
-            painter.setPen(QPen(QColor("#059669"), 1))
-            painter.drawEllipse(int(center_x - core_radius), int(center_y - core_radius),
-                               int(core_radius * 2), int(core_radius * 2))
+            set_brush(self._core_brush)
+            set_pen(self._core_pen)
+            draw_ellipse(self._core_rect)
             
             # 高光点
-            highlight_radius = 1.5
-            painter.setBrush(QBrush(QColor(255, 255, 255, 180)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(int(center_x - 2), int(center_y - 2),
-                               int(highlight_radius * 2), int(highlight_radius * 2))
+            set_brush(self._highlight_brush)
+            set_pen(no_pen)
+            draw_ellipse(self._highlight_rect)
         else:
-            # 未登录 - 灰色/红色暗淡效果
-            base_color = QColor("#6B7280")  # 灰色
-            
             # 外圈
-            outer_radius = 8
-            painter.setBrush(QBrush(QColor(60, 60, 60, 100)))
-            painter.setPen(QPen(QColor(80, 80, 80), 1))
-            painter.drawEllipse(int(center_x - outer_radius), int(center_y - outer_radius),
-                               int(outer_radius * 2), int(outer_radius * 2))
+            set_brush(self._inactive_outer_brush)
+            set_pen(self._inactive_outer_pen)
+            draw_ellipse(self._inactive_outer_rect)
             
-            # 核心圆点 - 暗红色
-            core_radius = 4
-            core_gradient = QRadialGradient(center_x - 0.5, center_y - 0.5, core_radius)
-            core_gradient.setColorAt(0, QColor("#9CA3AF"))  # 浅灰
-            core_gradient.setColorAt(0.5, QColor("#6B7280"))  # 中灰
-            core_gradient.setColorAt(1, QColor("#4B5563"))  # 深灰
-            painter.setBrush(QBrush(core_gradient))
-            painter.setPen(QPen(QColor("#4B5563"), 0.5))
-            painter.drawEllipse(int(center_x - core_radius), int(center_y - core_radius),
-                               int(core_radius * 2), int(core_radius * 2))
+            # 核心圆点
+            set_brush(self._inactive_core_brush)
+            set_pen(self._inactive_core_pen)
+            draw_ellipse(self._inactive_core_rect)
 
 
 class CookieCollector:
     """Cookie收集器"""
     def __init__(self):
         self.cookies = {}
+        self._cookies_setitem = self.cookies.__setitem__
     
     def on_cookie_added(self, cookie):
-        name = cookie.name().data().decode()
-        value = cookie.value().data().decode()
+        # 先按域名过滤，无关 Cookie 不做解码
         domain = cookie.domain()
-        if 'weixin' in domain or 'qq.com' in domain:
-            self.cookies[name] = value
+        if 'weixin' not in domain and 'qq.com' not in domain:
+            return
+        self._cookies_setitem(cookie.name().data().decode(), cookie.value().data().decode())
     
     def clear(self):
-        self.cookies = {}
+        self.cookies.clear()
 
 
 class CustomWebEnginePage(QWebEnginePage):
     """自定义WebEnginePage，拦截新窗口请求"""
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    def __init__(self, profile, parent=None):
+        super().__init__(profile, parent)
     
     def createWindow(self, window_type):
         """
@@ -240,6 +301,43 @@ class CustomWebEnginePage(QWebEnginePage):
         return True
 
 
+class _CodecSignals(QObject):
+    """
+    凭证编解码任务信号
+    
+    Signals:
+        finished(object): 任务完成，参数为编解码结果
+        failed(object): 任务失败，参数为异常对象
+    """
+    
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class _CodecWorker(QRunnable):
+    """
+    凭证编解码任务
+    
+    在线程池中执行 encode_cache_file / decode_to_cache_file，
+    结果或异常通过信号回到主线程，界面（包括状态指示灯动画）不会被文件读写卡住。
+    """
+    
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _CodecSignals()
+    
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(result)
+
+
 class ImportCredentialDialog(QDialog):
     """
     导入凭证对话框
@@ -256,6 +354,8 @@ class ImportCredentialDialog(QDialog):
         self.setWindowTitle("导入登录凭证")
         self.setMinimumSize(500, 350)
         self.setModal(True)
+        self._clipboard = QApplication.clipboard()
+        self._codec_worker = None
         
         # 设置暗色主题样式
         self.setStyleSheet("""
@@ -346,10 +446,18 @@ class ImportCredentialDialog(QDialog):
     
     def _on_paste_clicked(self):
         """从剪贴板粘贴"""
-        clipboard = QApplication.clipboard()
-        text = clipboard.text()
+        text = self._clipboard.text(QClipboard.Mode.Clipboard)
         if text:
-            self.input_edit.setPlainText(text.strip())
+            text = text.strip()
+            if len(text) > 4096:
+                # 长凭证直接写入文档，屏蔽逐次变更信号
+                self.input_edit.blockSignals(True)
+                try:
+                    self.input_edit.document().setPlainText(text)
+                finally:
+                    self.input_edit.blockSignals(False)
+            else:
+                self.input_edit.setPlainText(text)
             self._update_status("已从剪贴板粘贴", "#07C160")
         else:
             self._update_status("剪贴板为空", "#ff6b6b")
@@ -377,39 +485,47 @@ class ImportCredentialDialog(QDialog):
             self._update_status("请输入凭证字符串", "#ff6b6b")
             return
         
-        # 先验证
-        is_valid, message = validate_encoded_string(text)
-        if not is_valid:
-            self._update_status(f"✗ {message}", "#ff6b6b")
-            return
+        # 在线程池中执行解码和写入（解码本身会校验格式，无需再单独验证一遍）
+        self.import_btn.setEnabled(False)
+        self._update_status("正在导入...", "#888")
+        worker = _CodecWorker(decode_to_cache_file, text, backup=True)
+        worker.signals.finished.connect(self._on_import_finished)
+        worker.signals.failed.connect(self._on_import_failed)
+        # 保持引用，确保信号对象在任务结束前不被回收
+        self._codec_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_import_finished(self, data):
+        """导入完成"""
+        self._codec_worker = None
+        info = get_cache_info(data)
+        
+        self._update_status(
+            f"✓ 导入成功！Token: {info['token_preview']}, "
+            f"Cookie数量: {info['cookie_count']}",
+            "#07C160"
+        )
         
-        try:
-            # 执行解码和写入
-            data = decode_to_cache_file(text, backup=True)
-            info = get_cache_info(data)
-            
-            self._update_status(
-                f"✓ 导入成功！Token: {info['token_preview']}, "
-                f"Cookie数量: {info['cookie_count']}",
-                "#07C160"
-            )
-            
-            # 发送成功信号
-            self.import_success.emit()
-            
-            # 延迟关闭对话框
-            QTimer.singleShot(1500, self.accept)
-            
-        except ChecksumError as e:
+        # 发送成功信号
+        self.import_success.emit()
+        
+        # 延迟关闭对话框
+        QTimer.singleShot(1500, self.accept)
+    
+    def _on_import_failed(self, error):
+        """导入失败"""
+        self._codec_worker = None
+        self.import_btn.setEnabled(True)
+        if isinstance(error, ChecksumError):
             self._update_status(f"✗ 数据校验失败：凭证可能已损坏", "#ff6b6b")
-        except VersionError as e:
-            self._update_status(f"✗ 版本不兼容：{str(e)}", "#ff6b6b")
-        except ValidationError as e:
-            self._update_status(f"✗ 数据格式错误：{str(e)}", "#ff6b6b")
-        except DecodeError as e:
-            self._update_status(f"✗ 解码失败：{str(e)}", "#ff6b6b")
-        except Exception as e:
-            self._update_status(f"✗ 导入失败：{str(e)}", "#ff6b6b")
+        elif isinstance(error, VersionError):
+            self._update_status(f"✗ 版本不兼容：{str(error)}", "#ff6b6b")
+        elif isinstance(error, ValidationError):
+            self._update_status(f"✗ 数据格式错误：{str(error)}", "#ff6b6b")
+        elif isinstance(error, DecodeError):
+            self._update_status(f"✗ 解码失败：{str(error)}", "#ff6b6b")
+        else:
+            self._update_status(f"✗ 导入失败：{str(error)}", "#ff6b6b")
     
     def _update_status(self, message: str, color: str):
         """更新状态提示"""
@@ -428,18 +544,65 @@ class LoginPage(QWidget):
         self.cookie_collector = CookieCollector()
         self.setObjectName("loginPage")
         
+        # 合并短时间内连续的 URL 变化，每帧最多处理一次
+        self._pending_url = None
+        self._url_coalesce = QTimer(self)
+        self._url_coalesce.setSingleShot(True)
+        self._url_coalesce.setInterval(16)
+        self._url_coalesce.timeout.connect(self._process_pending_url)
+        
         # 强制设置暗黑背景
         self.setStyleSheet("background-color: #1a1a1a;")
         
+        # 登录专用浏览器配置（首次扫码登录时创建），Cookie 监听只在扫码登录期间连接
+        self._login_profile = None
+        self._cookie_conn = None
+        
+        # 导出凭证对话框，首次导出时创建后复用
+        self._export_dialog = None
+        self._exported_str = ""
+        self._codec_worker = None
+        
         self._setup_ui()
-        self._setup_cookie_listener()
         self._check_login_status()
     
-    def _setup_cookie_listener(self):
-        """设置Cookie监听器"""
-        profile = QWebEngineProfile.defaultProfile()
-        cookie_store = profile.cookieStore()
-        cookie_store.cookieAdded.connect(self.cookie_collector.on_cookie_added)
+    def _get_login_profile(self):
+        """
+        获取登录专用的浏览器配置
+        
+        使用独立的无痕 (off-the-record) 配置而非默认配置：
+        不落盘缓存，并关闭扫码登录用不到的插件、WebGL、图标加载等功能，
+        减少 Chromium 的内存和磁盘占用。
+        
+        Returns:
+            QWebEngineProfile: 登录专用配置
+        """
+        if self._login_profile is None:
+            profile = QWebEngineProfile(self)
+            settings = profile.settings()
+            attr = QWebEngineSettings.WebAttribute
+            settings.setAttribute(attr.PluginsEnabled, False)
+            settings.setAttribute(attr.AutoLoadIconsForPage, False)
+            settings.setAttribute(attr.WebGLEnabled, False)
+            settings.setAttribute(attr.Accelerated2dCanvasEnabled, False)
+            settings.setAttribute(attr.ShowScrollBars, False)
+            self._login_profile = profile
+        return self._login_profile
+    
+    def _connect_cookie_listener(self):
+        """开始监听浏览器 Cookie"""
+        if self._cookie_conn is not None:
+            return
+        cookie_store = self._get_login_profile().cookieStore()
+        self._cookie_conn = cookie_store.cookieAdded.connect(self.cookie_collector.on_cookie_added)
+    
+    def _disconnect_cookie_listener(self):
+        """停止监听浏览器 Cookie"""
+        if self._cookie_conn is None:
+            return
+        cookie_store = self._get_login_profile().cookieStore()
+        cookie_store.cookieAdded.disconnect(self._cookie_conn)
+        self._cookie_conn = None
     
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -454,12 +617,21 @@ class LoginPage(QWidget):
         self.status_view = self._create_status_view()
         self.stacked_widget.addWidget(self.status_view)
         
-        # 创建浏览器视图（内嵌浏览器）
-        self.browser_view = self._create_browser_view()
-        self.stacked_widget.addWidget(self.browser_view)
+        # 浏览器视图（内嵌浏览器）在首次扫码登录时才创建，这里先放占位控件
+        self.browser_view = None
+        self.webview = None
+        self._browser_placeholder = QWidget()
+        self.stacked_widget.addWidget(self._browser_placeholder)
         
         # 默认显示状态视图
         self.stacked_widget.setCurrentWidget(self.status_view)
+        
+        # 切换视图时同步状态指示灯动画（浏览器视图下无需动画）
+        self.stacked_widget.currentChanged.connect(self._on_view_changed)
+    
+    def _on_view_changed(self, index):
+        """视图切换时同步状态指示灯动画"""
+        self.status_indicator._sync_animations()
     
     def _create_status_view(self):
         """创建状态视图"""
@@ -567,10 +739,12 @@ class LoginPage(QWidget):
             "• 点击「导出凭证」可生成分享字符串，便于在其他设备使用",
             "• 点击「导入凭证」可粘贴他人分享的凭证快速登录",
         ]
-        for tip in tips:
-            tip_label = BodyLabel(tip)
-            tip_label.setStyleSheet("color: #888; padding-left: 8px;")
-            info_layout.addWidget(tip_label)
+        # 所有说明合并为一个富文本标签，减少控件数量
+        tip_label = BodyLabel()
+        tip_label.setTextFormat(Qt.TextFormat.RichText)
+        tip_label.setStyleSheet("color: #888; padding-left: 8px;")
+        tip_label.setText("<div style='line-height: 160%;'>" + "<br/>".join(tips) + "</div>")
+        info_layout.addWidget(tip_label)
         
         content_layout.addWidget(info_card)
         content_layout.addStretch()
@@ -582,6 +756,37 @@ class LoginPage(QWidget):
         
         return status_widget
     
+    def _ensure_browser_view(self):
+        """
+        确保浏览器视图已创建
+        
+        QWebEngineView 会启动 Chromium 进程并占用大量内存，
+        因此延迟到用户真正开始扫码登录时才创建，替换占位控件。
+        """
+        if self.browser_view is not None:
+            return
+        self.browser_view = self._create_browser_view()
+        self.stacked_widget.insertWidget(1, self.browser_view)
+        self.stacked_widget.removeWidget(self._browser_placeholder)
+    
+    def _release_browser_view(self):
+        """
+        释放浏览器视图
+        
+        登录成功后不再需要内嵌浏览器，换回占位控件并销毁 QWebEngineView。
+        """
+        if self.browser_view is None:
+            return
+        self._url_coalesce.stop()
+        self._pending_url = None
+        self.stacked_widget.insertWidget(1, self._browser_placeholder)
+        self.stacked_widget.removeWidget(self.browser_view)
+        self.webview.stop()
+        self.browser_view.deleteLater()
+        self.browser_view = None
+        self.webview = None
+        self.custom_page = None
+    
     def _create_browser_view(self):
         """创建浏览器视图"""
         browser_widget = QWidget()
@@ -620,7 +825,7 @@ class LoginPage(QWidget):
         self.webview = QWebEngineView(self)
         
         # 创建自定义页面并设置到webview
-        self.custom_page = CustomWebEnginePage(self.webview)
+        self.custom_page = CustomWebEnginePage(self._get_login_profile(), self.webview)
         self.webview.setPage(self.custom_page)
         
         # 连接信号
@@ -665,10 +870,11 @@ class LoginPage(QWidget):
         self.cookie_collector.clear()
         
         # 清除浏览器cookies
-        profile = QWebEngineProfile.defaultProfile()
-        profile.cookieStore().deleteAllCookies()
+        self._get_login_profile().cookieStore().deleteAllCookies()
+        self._connect_cookie_listener()
         
         # 切换到浏览器视图
+        self._ensure_browser_view()
         self.stacked_widget.setCurrentWidget(self.browser_view)
         
         # 加载微信公众平台
@@ -677,18 +883,31 @@ class LoginPage(QWidget):
     
     def _on_cancel_login(self):
         """取消登录 - 返回状态视图"""
-        self.webview.stop()
+        self._disconnect_cookie_listener()
+        if self.webview is not None:
+            self.webview.stop()
         self.stacked_widget.setCurrentWidget(self.status_view)
     
     def _on_url_changed(self, url):
-        """监听URL变化"""
-        url_str = url.toString()
+        """监听URL变化，只记录最新 URL，由合并定时器统一处理"""
+        self._pending_url = QUrl(url)
+        self._url_coalesce.start()
+    
+    def _process_pending_url(self):
+        """处理最近一次URL变化"""
+        url = self._pending_url
+        if url is None or self.browser_view is None:
+            return
+        self._pending_url = None
         self.browser_title.setText(f"微信公众平台 - {url.host()}")
         
-        # 检测登录成功（URL中包含token）
-        token_match = re.search(r'token=(\d+)', url_str)
+        # 检测登录成功（URL中包含token），先做子串预检再跑正则
+        raw = bytes(url.toEncoded())
+        if b'token=' not in raw:
+            return
+        token_match = _TOKEN_RE.search(raw)
         if token_match:
-            token = token_match.group(1)
+            token = token_match.group(1).decode('ascii')
             self.browser_title.setText("登录成功，正在保存登录信息...")
             QTimer.singleShot(1500, lambda: self._on_login_success(token))
     
@@ -696,12 +915,14 @@ class LoginPage(QWidget):
         """登录成功处理"""
         cookies = self.cookie_collector.cookies.copy()
         if cookies:
+            self._disconnect_cookie_listener()
             self.login_manager.token = token
             self.login_manager.cookies = cookies
             self.login_manager.save_cache()
             
-            # 切换回状态视图
+            # 切换回状态视图，并释放内嵌浏览器
             self.stacked_widget.setCurrentWidget(self.status_view)
+            self._release_browser_view()
             
             # 更新状态
             self._check_login_status()
@@ -747,45 +968,75 @@ class LoginPage(QWidget):
             )
             return
         
-        try:
-            # 编码缓存文件
-            encoded_str = encode_cache_file(self.login_manager.cache_file)
-            
-            # 复制到剪贴板
-            clipboard = QApplication.clipboard()
-            clipboard.setText(encoded_str)
-            
-            # 显示成功提示和导出结果
-            self._show_export_dialog(encoded_str)
-            
-        except FileNotFoundError:
-            InfoBar.error(
-                title="导出失败",
-                content="缓存文件不存在，请先登录",
-                parent=self,
-                position=InfoBarPosition.TOP,
-                duration=3000
-            )
-        except Exception as e:
-            InfoBar.error(
-                title="导出失败",
-                content=f"编码过程出错：{str(e)}",
-                parent=self,
-                position=InfoBarPosition.TOP,
-                duration=3000
-            )
+        # 在线程池中编码缓存文件
+        self.export_btn.setEnabled(False)
+        worker = _CodecWorker(encode_cache_file, self.login_manager.cache_file)
+        worker.signals.finished.connect(self._on_export_encoded)
+        worker.signals.failed.connect(self._on_export_failed)
+        # 保持引用，确保信号对象在任务结束前不被回收
+        self._codec_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_export_encoded(self, encoded_str: str):
+        """凭证编码完成，复制到剪贴板并显示结果"""
+        self._codec_worker = None
+        self.export_btn.setEnabled(True)
+        
+        # 复制到剪贴板
+        clipboard = QApplication.clipboard()
+        clipboard.setText(encoded_str)
+        
+        # 显示成功提示和导出结果
+        self._show_export_dialog(encoded_str)
+    
+    def _on_export_failed(self, error):
+        """凭证编码失败"""
+        self._codec_worker = None
+        self.export_btn.setEnabled(True)
+        if isinstance(error, FileNotFoundError):
+            content = "缓存文件不存在，请先登录"
+        else:
+            content = f"编码过程出错：{str(error)}"
+        InfoBar.error(
+            title="导出失败",
+            content=content,
+            parent=self,
+            position=InfoBarPosition.TOP,
+            duration=3000
+        )
     
     def _show_export_dialog(self, encoded_str: str):
         """
         显示导出结果对话框
         
+        对话框只在首次导出时创建，之后复用并仅更新字符串和长度说明。
+        
         Args:
             encoded_str: 编码后的凭证字符串
         """
         # 播放导出凭证音效
         play_sound('export')
         
-        # 创建对话框
+        if self._export_dialog is None:
+            self._create_export_dialog()
+        
+        self._exported_str = encoded_str
+        self._export_dialog_desc.setText(f"字符串长度: {len(encoded_str)} 字符")
+        self._export_dialog_text_edit.setPlainText(encoded_str)
+        
+        # 显示成功通知
+        InfoBar.success(
+            title="导出成功",
+            content="凭证已复制到剪贴板，可直接粘贴分享",
+            parent=self,
+            position=InfoBarPosition.TOP,
+            duration=3000
+        )
+        
+        self._export_dialog.exec()
+    
+    def _create_export_dialog(self):
+        """创建导出结果对话框"""
         dialog = QDialog(self)
         dialog.setWindowTitle("导出成功")
         dialog.setMinimumSize(500, 300)
@@ -806,13 +1057,12 @@ class LoginPage(QWidget):
         layout.addWidget(success_label)
         
         # 说明
-        desc = BodyLabel(f"字符串长度: {len(encoded_str)} 字符")
+        desc = BodyLabel()
         desc.setStyleSheet("color: #aaa; background-color: transparent;")
         layout.addWidget(desc)
         
         # 显示编码字符串
         text_edit = PlainTextEdit()
-        text_edit.setPlainText(encoded_str)
         text_edit.setReadOnly(True)
         text_edit.setMinimumHeight(100)
         text_edit.setStyleSheet("""
@@ -839,7 +1089,7 @@ class LoginPage(QWidget):
         btn_layout.addStretch()
         
         copy_btn = PushButton("再次复制", icon=FluentIcon.COPY)
-        copy_btn.clicked.connect(lambda: self._copy_to_clipboard(encoded_str))
+        copy_btn.clicked.connect(lambda: self._copy_to_clipboard(self._exported_str))
         btn_layout.addWidget(copy_btn)
         
         close_btn = PrimaryPushButton("关闭")
@@ -848,16 +1098,9 @@ class LoginPage(QWidget):
         
         layout.addLayout(btn_layout)
         
-        # 显示成功通知
-        InfoBar.success(
-            title="导出成功",
-            content="凭证已复制到剪贴板，可直接粘贴分享",
-            parent=self,
-            position=InfoBarPosition.TOP,
-            duration=3000
-        )
-        
-        dialog.exec()
+        self._export_dialog = dialog
+        self._export_dialog_desc = desc
+        self._export_dialog_text_edit = text_edit
     
     def _copy_to_clipboard(self, text: str):
         """复制文本到剪贴板"""
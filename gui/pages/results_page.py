@@ -28,19 +28,43 @@
     - HTML 导出支持单篇文章浏览和键盘导航
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView, QFileDialog, QTableWidgetItem, QAbstractItemView, QMenu
-from PyQt6.QtCore import Qt, QUrl, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QHeaderView, QFileDialog, QAbstractItemView, QMenu
+from PyQt6.QtCore import Qt, QUrl, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QDesktopServices, QAction
 import os
+import re
 import csv
 import json
+import heapq
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice, zip_longest
+from operator import itemgetter
 
-from qfluentwidgets import ScrollArea, TitleLabel, BodyLabel, CardWidget, PrimaryPushButton, PushButton, LineEdit, ComboBox, InfoBar, InfoBarPosition, FluentIcon, MessageBox
-from qfluentwidgets import TableWidget as FluentTable
+from qfluentwidgets import ScrollArea, TitleLabel, BodyLabel, CardWidget, PrimaryPushButton, PushButton, LineEdit, ComboBox, InfoBar, InfoBarPosition, FluentIcon, MessageBox, ProgressBar
+from qfluentwidgets import TableView as FluentTableView
 
 from ..styles import COLORS
 from ..widgets import ArticlePreviewDialog
-from ..utils import DEFAULT_OUTPUT_DIR
+from ..utils import DEFAULT_OUTPUT_DIR, FILENAME_BAD_CHARS
+
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# markdown-it-py 为可选依赖，解析速度远快于 markdown 库，安装时优先使用
+try:
+    from markdown_it import MarkdownIt
+except ImportError:
+    MarkdownIt = None
+
+# markdown 为可选依赖，两者都未安装时 HTML 导出使用简单的正则转换
+try:
+    import markdown
+except ImportError:
+    markdown = None
 
 # ============================================================
 # 导出格式配置
@@ -52,11 +76,776 @@ from ..utils import DEFAULT_OUTPUT_DIR
 SUPPORTED_FORMATS = {
     'csv': ('CSV文件', '.csv'),      # 通用表格格式，Excel可直接打开
     'json': ('JSON文件', '.json'),   # 结构化数据格式，便于程序处理
-    'xlsx': ('Excel文件', '.xlsx'),  # Excel原生格式，需要pandas和openpyxl
+    'xlsx': ('Excel文件', '.xlsx'),  # Excel原生格式，需要xlsxwriter或openpyxl
     'md': ('Markdown文件', '.md'),   # 文档格式，便于阅读和分享
     'html': ('HTML文件', '.html'),   # 网页格式，支持交互式浏览
 }
 
+# HTML 导出中单篇文章的 JSON 记录模板，字段值为已编码的 JSON 字面量
+# （紧凑格式，不含多余空格）
+_HTML_ARTICLE_RECORD = (
+    '{sep}{{"index":{index},"title":{title},"account":{account},'
+    '"pub_time":{pub_time},"link":{link},"content":{content}}}'
+)
+
+# HTML 导出页面的样式表，所有导出共用同一个字符串常量
+_HTML_STYLE = """    <style>
+        * { box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            margin: 0;
+            padding: 0;
+            background: #f5f5f5;
+            min-height: 100vh;
+            display: flex;
+            flex-direction: column;
+        }
+        
+        /* 顶部导航栏 */
+        .header {
+            background: linear-gradient(135deg, #07c160 0%, #05a14e 100%);
+            color: white;
+            padding: 15px 20px;
+            position: sticky;
+            top: 0;
+            z-index: 100;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.2);
+        }
+        .header h1 {
+            margin: 0 0 10px 0;
+            font-size: 20px;
+            font-weight: 600;
+        }
+        .nav-controls {
+            display: flex;
+            align-items: center;
+            gap: 15px;
+            flex-wrap: wrap;
+        }
+        .nav-btn {
+            background: rgba(255,255,255,0.2);
+            border: none;
+            color: white;
+            padding: 8px 20px;
+            border-radius: 20px;
+            cursor: pointer;
+            font-size: 14px;
+            transition: all 0.3s;
+            display: flex;
+            align-items: center;
+            gap: 5px;
+        }
+        .nav-btn:hover:not(:disabled) {
+            background: rgba(255,255,255,0.3);
+            transform: translateY(-1px);
+        }
+        .nav-btn:disabled {
+            opacity: 0.5;
+            cursor: not-allowed;
+        }
+        .page-info {
+            background: rgba(255,255,255,0.2);
+            padding: 8px 15px;
+            border-radius: 20px;
+            font-size: 14px;
+        }
+        .article-select {
+            padding: 8px 12px;
+            border-radius: 20px;
+            border: none;
+            background: rgba(255,255,255,0.9);
+            color: #333;
+            font-size: 14px;
+            max-width: 300px;
+            cursor: pointer;
+        }
+        
+        /* 文章容器 */
+        .article-container {
+            flex: 1;
+            max-width: 900px;
+            margin: 20px auto;
+            padding: 0 20px;
+            width: 100%;
+        }
+        .article {
+            background: white;
+            border-radius: 12px;
+            padding: 30px;
+            box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+            animation: fadeIn 0.3s ease;
+        }
+        @keyframes fadeIn {
+            from { opacity: 0; transform: translateY(10px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
+        .article h2 {
+            color: #07c160;
+            margin: 0 0 20px 0;
+            font-size: 24px;
+            line-height: 1.4;
+        }
+        .meta {
+            color: #666;
+            font-size: 14px;
+            margin-bottom: 25px;
+            padding-bottom: 15px;
+            border-bottom: 1px solid #eee;
+            display: flex;
+            flex-wrap: wrap;
+            gap: 15px;
+        }
+        .meta-item {
+            display: flex;
+            align-items: center;
+            gap: 5px;
+        }
+        .content {
+            line-height: 1.9;
+            color: #333;
+            font-size: 16px;
+        }
+        .content img {
+            max-width: 100%;
+            height: auto;
+            border-radius: 8px;
+            margin: 15px 0;
+        }
+        .content p {
+            margin: 0 0 15px 0;
+        }
+        .content a {
+            color: #07c160;
+            text-decoration: none;
+        }
+        .content a:hover {
+            text-decoration: underline;
+        }
+        .no-content {
+            color: #999;
+            font-style: italic;
+            text-align: center;
+            padding: 40px;
+        }
+        
+        /* 底部导航 */
+        .footer-nav {
+            background: white;
+            padding: 15px 20px;
+            display: flex;
+            justify-content: center;
+            gap: 20px;
+            box-shadow: 0 -2px 10px rgba(0,0,0,0.05);
+        }
+        .footer-btn {
+            background: #07c160;
+            border: none;
+            color: white;
+            padding: 12px 30px;
+            border-radius: 25px;
+            cursor: pointer;
+            font-size: 15px;
+            transition: all 0.3s;
+            display: flex;
+            align-items: center;
+            gap: 8px;
+        }
+        .footer-btn:hover:not(:disabled) {
+            background: #05a14e;
+            transform: translateY(-2px);
+            box-shadow: 0 4px 15px rgba(7,193,96,0.3);
+        }
+        .footer-btn:disabled {
+            background: #ccc;
+            cursor: not-allowed;
+        }
+        
+        /* 键盘快捷键提示 */
+        .keyboard-hint {
+            text-align: center;
+            color: #999;
+            font-size: 12px;
+            padding: 10px;
+            background: #f9f9f9;
+        }
+        .keyboard-hint kbd {
+            background: #eee;
+            padding: 2px 8px;
+            border-radius: 4px;
+            border: 1px solid #ddd;
+            font-family: monospace;
+        }
+        
+        /* 响应式设计 */
+        @media (max-width: 768px) {
+            .header h1 { font-size: 18px; }
+            .nav-controls { gap: 10px; }
+            .nav-btn { padding: 6px 15px; font-size: 13px; }
+            .article { padding: 20px; }
+            .article h2 { font-size: 20px; }
+            .content { font-size: 15px; }
+            .article-select { max-width: 200px; }
+        }
+    </style>
+"""
+
+# HTML 导出页面的固定部分：文章总数写在 _HTML_HEAD 与 _HTML_BODY 之间，
+# 随后是页面数据常量、浏览脚本 _HTML_VIEWER_SCRIPT、内嵌数据和 _HTML_TAIL
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>微信公众号文章爬取结果</title>
+""" + _HTML_STYLE + """</head>
+<body>
+    <div class="header">
+        <h1>📚 微信公众号文章爬取结果</h1>
+        <div class="nav-controls">
+            <button class="nav-btn" id="prevBtn" onclick="prevArticle()">
+                ◀ 上一篇
+            </button>
+            <span class="page-info" id="pageInfo">1 / """
+
+_HTML_BODY = """</span>
+            <button class="nav-btn" id="nextBtn" onclick="nextArticle()">
+                下一篇 ▶
+            </button>
+            <select class="article-select" id="articleSelect" onchange="goToArticle(this.value)">
+            </select>
+        </div>
+    </div>
+    
+    <div class="article-container">
+        <div class="article" id="articleContent">
+            <!-- 文章内容将通过JavaScript动态填充 -->
+            <h2 id="articleTitle"></h2>
+            <div class="meta">
+                <span class="meta-item">📱 公众号: <span id="articleAccount"></span></span>
+                <span class="meta-item">📅 发布时间: <span id="articleTime"></span></span>
+                <span class="meta-item" id="articleLinkItem">🔗 <a id="articleLink" target="_blank">原文链接</a></span>
+            </div>
+            <div class="content" id="articleBody"></div>
+        </div>
+    </div>
+    
+    <div class="footer-nav">
+        <button class="footer-btn" id="footerPrevBtn" onclick="prevArticle()">
+            ◀ 上一篇
+        </button>
+        <button class="footer-btn" id="footerNextBtn" onclick="nextArticle()">
+            下一篇 ▶
+        </button>
+    </div>
+    
+    <div class="keyboard-hint">
+        💡 快捷键: <kbd>←</kbd> 上一篇 | <kbd>→</kbd> 下一篇 | <kbd>Home</kbd> 第一篇 | <kbd>End</kbd> 最后一篇
+    </div>
+
+    <script>
+        // 文章数据按页存放，每页 pageSize 篇：单文件导出时全部文章作为第 0 页
+        // 内嵌在页面末尾的 JSON 数据块（articleData）中，
+        // 分页导出时各页保存在 pageDir 目录下的 articles_N.js 中，浏览到时再加载
+"""
+
+_HTML_VIEWER_SCRIPT = """        const MAX_CACHED_PAGES = 5;
+        const pages = new Map();
+        const pageCallbacks = new Map();
+        const NO_CONTENT_HTML = '<div class="no-content">暂无内容</div>';
+        let currentIndex = 0;
+        let renderPending = false;
+        // 页面元素引用，init 时查找一次
+        let nodes = null;
+        
+        // 登记一页文章数据（由内嵌数据或数据页脚本调用）
+        function loadArticlePage(page, data) {
+            pages.set(page, data);
+            // 只保留最近使用的几页
+            if (pages.size > MAX_CACHED_PAGES) {
+                pages.delete(pages.keys().next().value);
+            }
+            const callbacks = pageCallbacks.get(page) || [];
+            pageCallbacks.delete(page);
+            callbacks.forEach(callback => callback(data));
+        }
+        
+        // 取得指定文章，所在页未加载时先加载数据页脚本
+        function withArticle(index, callback) {
+            const page = Math.floor(index / pageSize);
+            const offset = index - page * pageSize;
+            const data = pages.get(page);
+            if (data) {
+                // 重新插入，标记为最近使用
+                pages.delete(page);
+                pages.set(page, data);
+                callback(data[offset]);
+                return;
+            }
+            if (!pageCallbacks.has(page)) {
+                pageCallbacks.set(page, []);
+                const script = document.createElement('script');
+                script.src = `${encodeURIComponent(pageDir)}/articles_${page}.js`;
+                // 数据页缺失（如只移动了 HTML 文件）时提示，并允许之后重试
+                script.onerror = () => {
+                    pageCallbacks.delete(page);
+                    script.remove();
+                    if (Math.floor(currentIndex / pageSize) === page) {
+                        showMissingData(currentIndex);
+                    }
+                };
+                document.head.appendChild(script);
+            }
+            pageCallbacks.get(page).push(pageData => callback(pageData[offset]));
+        }
+        
+        // 初始化
+        function init() {
+            // 内嵌数据用 JSON.parse 解析，比作为脚本字面量解析更快
+            const dataBlock = document.getElementById('articleData');
+            if (dataBlock) {
+                loadArticlePage(0, JSON.parse(dataBlock.textContent));
+            }
+            
+            nodes = {
+                title: document.getElementById('articleTitle'),
+                account: document.getElementById('articleAccount'),
+                time: document.getElementById('articleTime'),
+                linkItem: document.getElementById('articleLinkItem'),
+                link: document.getElementById('articleLink'),
+                body: document.getElementById('articleBody'),
+                pageInfo: document.getElementById('pageInfo'),
+                select: document.getElementById('articleSelect'),
+                buttons: ['prevBtn', 'footerPrevBtn', 'nextBtn', 'footerNextBtn'].map(id => document.getElementById(id)),
+            };
+            
+            // 填充下拉选择框：选项先放入文档片段，最后一次性插入
+            const select = nodes.select;
+            const fragment = document.createDocumentFragment();
+            titles.forEach((title, index) => {
+                const option = document.createElement('option');
+                option.value = index;
+                option.textContent = `${index + 1}. ${title}`;
+                fragment.appendChild(option);
+            });
+            select.appendChild(fragment);
+            
+            if (total === 0) {
+                document.getElementById('articleContent').innerHTML = NO_CONTENT_HTML;
+                updateButtons();
+                return;
+            }
+            
+            // 显示第一篇文章
+            showArticle(0);
+        }
+        
+        // 显示指定文章
+        // 页面更新在下一帧统一进行，连续切换（如按住方向键）时一帧只渲染最后一篇
+        function showArticle(index) {
+            if (index < 0 || index >= total) return;
+            
+            currentIndex = index;
+            if (renderPending) return;
+            renderPending = true;
+            requestAnimationFrame(() => {
+                renderPending = false;
+                const target = currentIndex;
+                withArticle(target, article => {
+                    // 数据页加载期间已切换到其他文章
+                    if (target !== currentIndex) return;
+                    renderArticle(target, article);
+                });
+            });
+        }
+        
+        // 数据页无法加载时，在正文区域提示缺少的数据文件夹
+        function showMissingData(index) {
+            // 标题在导出时已转义为 HTML
+            nodes.title.innerHTML = `${index + 1}. ${titles[index]}`;
+            nodes.account.textContent = '';
+            nodes.time.textContent = '';
+            nodes.linkItem.style.display = 'none';
+            const message = document.createElement('div');
+            message.className = 'no-content';
+            message.textContent = `数据文件缺失：请将 ${pageDir} 文件夹与本页面放在同一目录后刷新`;
+            nodes.body.replaceChildren(message);
+            nodes.pageInfo.textContent = `${index + 1} / ${total}`;
+            nodes.select.value = index;
+            updateButtons();
+        }
+        
+        // 渲染文章内容：页面骨架固定不变，只更新各处的文本和正文
+        function renderArticle(index, article) {
+            // 标题等字段在导出时已转义为 HTML
+            nodes.title.innerHTML = `${article.index}. ${article.title}`;
+            nodes.account.innerHTML = article.account;
+            nodes.time.innerHTML = article.pub_time;
+            if (article.link) {
+                nodes.link.href = article.link;
+                nodes.linkItem.style.display = '';
+            } else {
+                nodes.linkItem.style.display = 'none';
+            }
+            nodes.body.innerHTML = article.content || NO_CONTENT_HTML;
+            
+            // 更新页码信息
+            nodes.pageInfo.textContent = `${index + 1} / ${total}`;
+            
+            // 更新下拉选择框
+            nodes.select.value = index;
+            
+            // 更新按钮状态
+            updateButtons();
+            
+            // 滚动到顶部
+            window.scrollTo({ top: 0, behavior: 'smooth' });
+        }
+        
+        // 更新按钮状态
+        function updateButtons() {
+            const isFirst = currentIndex === 0;
+            const isLast = currentIndex === total - 1;
+            const [prevBtn, footerPrevBtn, nextBtn, footerNextBtn] = nodes.buttons;
+            
+            prevBtn.disabled = isFirst;
+            nextBtn.disabled = isLast;
+            footerPrevBtn.disabled = isFirst;
+            footerNextBtn.disabled = isLast;
+        }
+        
+        // 上一篇
+        function prevArticle() {
+            if (currentIndex > 0) {
+                showArticle(currentIndex - 1);
+            }
+        }
+        
+        // 下一篇
+        function nextArticle() {
+            if (currentIndex < total - 1) {
+                showArticle(currentIndex + 1);
+            }
+        }
+        
+        // 跳转到指定文章
+        function goToArticle(index) {
+            showArticle(parseInt(index));
+        }
+        
+        // 键盘快捷键
+        document.addEventListener('keydown', function(e) {
+            // 如果焦点在输入框或选择框中，不处理快捷键
+            if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT' || e.target.tagName === 'TEXTAREA') {
+                return;
+            }
+            
+            switch(e.key) {
+                case 'ArrowLeft':
+                    prevArticle();
+                    e.preventDefault();
+                    break;
+                case 'ArrowRight':
+                    nextArticle();
+                    e.preventDefault();
+                    break;
+                case 'Home':
+                    showArticle(0);
+                    e.preventDefault();
+                    break;
+                case 'End':
+                    showArticle(total - 1);
+                    e.preventDefault();
+                    break;
+            }
+        });
+        
+        // 页面加载完成后初始化
+        document.addEventListener('DOMContentLoaded', init);
+    </script>
+"""
+
+_HTML_TAIL = """</body>
+</html>
+"""
+
+# HTML 特殊字符转义表（str.translate 单次扫描完成全部替换）
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'})
+
+# CSV/Excel 导出单个文件的最大文章数，超过时拆分为 name_1、name_2 … 多个文件
+# （xlsx 单表上限为 1048576 行）
+EXPORT_SEGMENT_SIZE = 250000
+
+# HTML 导出每页的文章数，超过一页时数据拆分为单独的脚本文件按需加载
+HTML_PAGE_SIZE = 1000
+
+# markdown-it-py 解析器，启用与 markdown 库 tables/fenced_code 扩展对应的语法
+_MARKDOWN_IT = MarkdownIt('commonmark').enable(['table', 'strikethrough']) if MarkdownIt is not None else None
+
+# 没有 markdown 库时的简单转换：HTML 转义的同时把换行转为 <br>
+_MD_FALLBACK_TABLE = {**_HTML_ESCAPE, ord('\n'): '<br>'}
+
+# 没有 markdown 库时转换图片和链接用的正则
+_MD_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# 导出文件的写缓冲大小（1 MiB），逐行的小块写入在缓冲区中合并后再落盘
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# 表格显示的列（同时也是文章字典中的键）
+TABLE_COLUMNS = ('公众号', '标题', '发布时间')
+
+
+@lru_cache(maxsize=4096)
+def _qurl(url):
+    """解析链接为 QUrl，同一链接只解析一次"""
+    return QUrl(url)
+
+
+def _render_markdown(md_text):
+    """
+    Markdown 转 HTML
+    
+    可用的 Markdown 库在模块加载时确定，这里直接调用。
+    
+    Args:
+        md_text: 非空的 Markdown 文本
+    
+    Returns:
+        HTML 片段
+    """
+    if _MARKDOWN_IT is not None:
+        return _MARKDOWN_IT.render(md_text)
+    if markdown is not None:
+        return markdown.markdown(md_text, extensions=['tables', 'fenced_code'])
+    
+    # 如果没有markdown库，进行简单转换
+    # 转义和换行在同一次 translate 中完成；转义后的文本不含 "<"，
+    # 连续两个 <br> 只可能来自空行，再替换为段落分隔
+    html = md_text.translate(_MD_FALLBACK_TABLE)
+    html = html.replace('<br><br>', '</p><p>')
+    # 图片和链接都以 "](" 连接，正文中没有时跳过两次正则扫描
+    if '](' in html:
+        # 转换图片
+        html = _MD_IMAGE_RE.sub(r'<img src="\2" alt="\1">', html)
+        # 转换链接
+        html = _MD_LINK_RE.sub(r'<a href="\2">\1</a>', html)
+    return f'<p>{html}</p>'
+
+
+@lru_cache(maxsize=4096)
+def _escape_html_cached(text):
+    """转义HTML特殊字符，公众号名等重复出现的字段只转义一次"""
+    return text.translate(_HTML_ESCAPE)
+
+
+def _script_safe(json_text):
+    """
+    使 JSON 文本可以安全地嵌入 <script> 元素
+    
+    字段值（正文 HTML、链接等）中的 "</script>" 或 "<!--" 会提前结束或打乱脚本元素，
+    改写为等价的 JSON 转义形式，解析结果不变。
+    """
+    return json_text.replace('</', '<\\/').replace('<!--', '<\\u0021--')
+
+
+def _short_title(title, limit=30):
+    """截断过长的标题（用于 HTML 导出的文章下拉框）"""
+    if not title:
+        return ''
+    title = str(title)
+    return title[:limit] + '...' if len(title) > limit else title
+
+
+def _iter_progress(articles, progress_callback, step=500):
+    """
+    遍历文章列表，每处理 step 篇回报一次进度
+    
+    Args:
+        articles: 文章列表
+        progress_callback: 进度回调 (已处理数, 总数)，为 None 时直接遍历原列表
+        step: 回报间隔（篇）
+    
+    Returns:
+        文章迭代器
+    """
+    if progress_callback is None:
+        return iter(articles)
+    
+    def gen():
+        total = len(articles)
+        for i, article in enumerate(articles, 1):
+            yield article
+            if i % step == 0 or i == total:
+                progress_callback(i, total)
+    return gen()
+
+
+def _html_page_dir(file_path):
+    """分页 HTML 导出时存放数据页的文件夹名（与页面文件同目录）"""
+    return os.path.splitext(os.path.basename(file_path))[0] + '_files'
+
+
+def _offset_progress(progress_callback, offset, total, current, _):
+    """将分段内的进度换算为全部文章的累计进度后回报"""
+    progress_callback(offset + current, total)
+
+
+def _read_csv_articles(f):
+    """
+    读取 CSV 文件中的文章记录
+    
+    与 csv.DictReader 的结果相同：跳过空行，字段少于表头时缺少的列为 None，
+    字段多于表头时多余的值以列表形式保存在 None 键下。表头只解析一次，
+    字段数与表头一致的行直接配对成字典。
+    
+    Args:
+        f: 以 newline='' 打开的文本文件对象
+    
+    Returns:
+        文章字典列表
+    """
+    reader = csv.reader(f)
+    header = next(reader, [])
+    width = len(header)
+    articles = []
+    for row in reader:
+        if not row:
+            continue
+        if len(row) == width:
+            articles.append(dict(zip(header, row)))
+            continue
+        article = dict(zip_longest(header, row[:width]))
+        if len(row) > width:
+            article[None] = row[width:]
+        articles.append(article)
+    return articles
+
+
+class _ExportSignals(QObject):
+    """
+    导出任务信号
+    
+    QRunnable 不是 QObject，无法直接定义信号，由该对象代为发射。
+    
+    Signals:
+        finished(object): 导出完成，参数为 (文件路径, 导出的文章列表)，
+            分段导出时文件路径为第一个分段文件
+        failed(str): 导出失败，参数为错误消息
+        progress(int, int): 导出进度，参数为 (已处理数, 总数)
+    """
+    
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
+
+
+class _ExportWorker(QRunnable):
+    """
+    导出任务
+    
+    在线程池中调用导出函数写文件，避免大数据量导出时界面卡顿。
+    导出的是启动时的文章列表快照，期间页面加载新数据不影响本次导出。
+    """
+    
+    def __init__(self, export_func, file_path, articles):
+        super().__init__()
+        self.export_func = export_func
+        self.file_path = file_path
+        self.articles = articles
+        self.signals = _ExportSignals()
+    
+    def run(self):
+        try:
+            saved_path = self.export_func(self.file_path, self.articles, self.signals.progress.emit)
+            self.signals.finished.emit((saved_path or self.file_path, self.articles))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class ArticlesTableModel(QAbstractTableModel):
+    """
+    文章表格数据模型
+    
+    直接持有文章字典列表，视图只为可见单元格调用 data()，
+    不再为每个单元格创建 QTableWidgetItem。显示的各列在加载时
+    按列拆成并行列表，data() 只需两次列表下标访问。
+    
+    筛选结果以行号列表（_view）表示，筛选变化时只替换行号列表
+    并重置一次模型，不经过逐行回调的代理模型。
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # 按列存储的显示数据，与 TABLE_COLUMNS 一一对应
+        self._columns = tuple([] for _ in TABLE_COLUMNS)
+        # 当前显示的文章下标列表，None 表示全部显示
+        self._view = None
+        # 按 _view 取出的文章列表缓存，数据或筛选变化时清空
+        self._visible = None
+    
+    def set_articles(self, articles, view=None):
+        """整体替换文章列表及显示的行号，只触发一次模型重置"""
+        self.beginResetModel()
+        self._rows = articles
+        self._columns = tuple([a.get(key, '') for a in articles] for key in TABLE_COLUMNS)
+        self._view = view
+        self._visible = None
+        self.endResetModel()
+    
+    def set_view(self, view):
+        """
+        设置显示的行
+        
+        Args:
+            view: 升序的文章下标列表，None 表示全部显示
+        """
+        self.beginResetModel()
+        self._view = view
+        self._visible = None
+        self.endResetModel()
+    
+    def article(self, row):
+        """获取指定显示行的文章字典"""
+        if self._view is not None:
+            row = self._view[row]
+        return self._rows[row]
+    
+    def visible_articles(self):
+        """
+        获取当前显示的文章列表（与表格顺序一致）
+        
+        结果在筛选条件不变期间缓存，调用方不应修改返回的列表。
+        """
+        if self._visible is None:
+            if self._view is None:
+                self._visible = list(self._rows)
+            else:
+                rows = self._rows
+                self._visible = [rows[i] for i in self._view]
+        return self._visible
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows) if self._view is None else len(self._view)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(TABLE_COLUMNS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.ToolTipRole:
+            row = index.row()
+            if self._view is not None:
+                row = self._view[row]
+            return self._columns[index.column()][row]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return TABLE_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
 
 class ResultsPage(ScrollArea):
     """
@@ -101,6 +890,15 @@ class ResultsPage(ScrollArea):
         self.source_info = ""
         # 临时文件路径，爬取时自动保存的文件，用户放弃时需要删除
         self.temp_file_path = None
+        # 筛选用缓存：小写标题和公众号名，与 articles 一一对应，加载时计算一次
+        self._titles_lower = []
+        self._accounts = []
+        # 公众号下拉框当前的选项（已排序，不含“全部”）
+        self._account_choices = []
+        # 公众号反向索引：公众号名 -> 升序的文章下标列表，加载时构建
+        self._by_account = {}
+        # 进行中的导出任务（保持引用直到完成）
+        self._export_worker = None
         
         # 设置对象名称，用于样式表选择器
         self.setObjectName("resultsPage")
@@ -161,6 +959,12 @@ class ResultsPage(ScrollArea):
         self.save_btn.clicked.connect(self._on_save_results)
         self.save_btn.hide()  # 默认隐藏，有未保存数据时显示
         source_layout.addWidget(self.save_btn)
+        
+        # 导出进度条，仅在保存过程中显示
+        self.export_progress = ProgressBar()
+        self.export_progress.setFixedWidth(160)
+        self.export_progress.hide()
+        source_layout.insertWidget(source_layout.indexOf(self.discard_btn), self.export_progress)
         self.source_card.hide()  # 默认隐藏
         layout.addWidget(self.source_card)
         
@@ -210,6 +1014,11 @@ class ResultsPage(ScrollArea):
         self.search_input = LineEdit()
         self.search_input.setPlaceholderText("输入关键词搜索标题...")
         self.search_input.textChanged.connect(self._on_search)
+        # 搜索防抖：停止输入 150ms 后才执行筛选
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_filters)
         self.search_input.setMaximumWidth(300)
         filter_layout.addWidget(self.search_input)
         filter_layout.addWidget(BodyLabel("公众号:"))
@@ -223,13 +1032,19 @@ class ResultsPage(ScrollArea):
         filter_layout.addWidget(self.count_label)
         layout.addLayout(filter_layout)
         
-        self.data_table = FluentTable()
-        self.data_table.setColumnCount(3)
-        self.data_table.setHorizontalHeaderLabels(["公众号", "标题", "发布时间"])
-        self.data_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.table_model = ArticlesTableModel(self)
+        self.data_table = FluentTableView()
+        self.data_table.setModel(self.table_model)
+        # 固定行高和列宽：ResizeToContents 会在每次加载/筛选后测量所有行的文本
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.data_table.verticalHeader().setDefaultSectionSize(40)
+        self.data_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
         self.data_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.data_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.data_table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.data_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        self.data_table.setColumnWidth(0, 180)
+        # 发布时间列宽按时间格式的文本宽度加单元格内边距计算
+        self.data_table.setColumnWidth(2, self.data_table.fontMetrics().horizontalAdvance("0000-00-00 00:00:00") + 40)
+        self.data_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.data_table.doubleClicked.connect(self._on_table_double_clicked)
         # 禁用双击编辑功能
         self.data_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
@@ -253,14 +1068,13 @@ class ResultsPage(ScrollArea):
         self.recent_combo.addItem("选择文件...")
         results_dir = DEFAULT_OUTPUT_DIR
         if os.path.exists(results_dir):
-            csv_files = [(f, os.path.join(results_dir, f), os.path.getmtime(os.path.join(results_dir, f))) for f in os.listdir(results_dir) if f.endswith('.csv')]
-            csv_files.sort(key=lambda x: x[2], reverse=True)
-            for name, path, _ in csv_files[:10]:
+            # scandir 的目录项自带文件信息，只需取最新的 10 个，不必全部排序
+            with os.scandir(results_dir) as it:
+                csv_files = [(entry.name, entry.path, entry.stat().st_mtime) for entry in it if entry.name.endswith('.csv')]
+            for name, path, _ in heapq.nlargest(10, csv_files, key=itemgetter(2)):
                 self.recent_combo.addItem(name, userData=path)
     
     def _on_browse_file(self):
-        # 导入默认输出目录
-        from gui.utils import DEFAULT_OUTPUT_DIR
         file_path, _ = QFileDialog.getOpenFileName(self, "选择CSV文件", DEFAULT_OUTPUT_DIR, "CSV文件 (*.csv)")
         if file_path:
             self.file_input.setText(file_path)
@@ -285,34 +1099,61 @@ class ResultsPage(ScrollArea):
     
     def _load_csv_file(self, file_path):
         try:
-            self.articles = []
-            accounts = set()
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    self.articles.append(row)
-                    if '公众号' in row:
-                        accounts.add(row['公众号'])
+            with open(file_path, 'r', encoding='utf-8-sig', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+                self.articles = _read_csv_articles(f)
+            accounts = dict.fromkeys(row['公众号'] for row in self.articles if '公众号' in row)
             self.current_file = file_path
-            self.account_filter.clear()
-            self.account_filter.addItem("全部")
-            for account in sorted(accounts):
-                self.account_filter.addItem(account)
-            self._display_articles(self.articles)
+            self._set_account_choices(accounts)
+            self._display_articles()
             InfoBar.success(title="加载成功", content=f"成功加载 {len(self.articles)} 条记录", parent=self, position=InfoBarPosition.TOP, duration=3000)
         except Exception as e:
             InfoBar.error(title="加载失败", content=str(e), parent=self, position=InfoBarPosition.TOP, duration=3000)
     
-    def _display_articles(self, articles):
-        self.data_table.setRowCount(len(articles))
-        for i, article in enumerate(articles):
-            self.data_table.setItem(i, 0, QTableWidgetItem(article.get('公众号', '')))
-            self.data_table.setItem(i, 1, QTableWidgetItem(article.get('标题', '')))
-            self.data_table.setItem(i, 2, QTableWidgetItem(article.get('发布时间', '')))
-        self.count_label.setText(f"共 {len(articles)} 条记录")
+    def _set_account_choices(self, accounts):
+        """
+        更新公众号过滤下拉框
+        
+        选项与上次相同时（如重新加载同一文件）只复位到“全部”，
+        不清空重建下拉框。更新期间屏蔽下拉框信号，避免清空和添加
+        选项时按旧数据重复筛选，由调用方在数据就绪后统一刷新表格。
+        
+        Args:
+            accounts: 公众号名称的可迭代对象（不含重复项）
+        """
+        choices = sorted(accounts)
+        self.account_filter.blockSignals(True)
+        try:
+            if choices == self._account_choices:
+                self.account_filter.setCurrentIndex(0)
+                return
+            self._account_choices = choices
+            self.account_filter.clear()
+            self.account_filter.addItem("全部")
+            self.account_filter.addItems(choices)
+        finally:
+            self.account_filter.blockSignals(False)
+    
+    def _display_articles(self):
+        """
+        将 self.articles 交给表格模型，并按当前筛选条件显示
+        
+        先按新数据建好筛选缓存并算出显示的行，再连同数据一起
+        重置模型一次，不会先全部显示再过滤一遍。
+        """
+        articles = self.articles
+        # 字段缺失或为 null（JSON 结果）时按空字符串处理
+        self._accounts = [a.get('公众号') or '' for a in articles]
+        self._titles_lower = [(a.get('标题') or '').lower() for a in articles]
+        by_account = {}
+        for row, account in enumerate(self._accounts):
+            by_account.setdefault(account, []).append(row)
+        self._by_account = by_account
+        self._search_timer.stop()
+        self.table_model.set_articles(articles, self._filter_rows())
+        self.count_label.setText(f"共 {self.table_model.rowCount()} 条记录")
     
     def _on_search(self, text):
-        self._apply_filters()
+        self._search_timer.start()
     
     def _on_filter_changed(self, account):
         self._apply_filters()
@@ -323,13 +1164,32 @@ class ResultsPage(ScrollArea):
         
         根据搜索关键词和公众号筛选条件过滤文章列表。
         """
+        self._search_timer.stop()
+        self.table_model.set_view(self._filter_rows())
+        self.count_label.setText(f"共 {self.table_model.rowCount()} 条记录")
+    
+    def _filter_rows(self):
+        """
+        按当前搜索关键词和公众号计算显示的行
+        
+        Returns:
+            升序的文章下标列表，None 表示全部显示
+        """
         search_text = self.search_input.text().strip().lower()
         account_filter = self.account_filter.currentText()
         # 组合筛选条件：公众号匹配 AND 标题包含关键词
-        filtered = [a for a in self.articles if (account_filter == "全部" or a.get('公众号', '') == account_filter) and (not search_text or search_text in a.get('标题', '').lower())]
-        self._display_articles(filtered)
+        if search_text:
+            titles = self._titles_lower
+            if account_filter != "全部":
+                # 只在该公众号的行中查找关键词
+                return [row for row in self._by_account.get(account_filter, ()) if search_text in titles[row]]
+            return [row for row, title in enumerate(titles) if search_text in title]
+        if account_filter == "全部":
+            return None
+        # 只按公众号筛选时直接取反向索引，无需扫描全部文章
+        return list(self._by_account.get(account_filter, ()))
     
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, selected, deselected):
         """表格选择变化时的处理（保留用于未来扩展）"""
         pass
     
@@ -344,7 +1204,7 @@ class ResultsPage(ScrollArea):
         创建或重用预览对话框，显示当前选中文章的详细内容，
         支持在对话框中切换上一篇/下一篇文章。
         """
-        row = self.data_table.currentRow()
+        row = self.data_table.currentIndex().row()
         if row < 0:
             return
         
@@ -364,32 +1224,28 @@ class ResultsPage(ScrollArea):
     
     def _on_preview_article_changed(self, index):
         """预览对话框中切换文章时同步选中表格行"""
-        if 0 <= index < self.data_table.rowCount():
+        if 0 <= index < self.table_model.rowCount():
             self.data_table.selectRow(index)
     
     def _get_filtered_articles(self):
-        """获取当前过滤后的文章列表"""
-        search_text = self.search_input.text().strip().lower()
-        account_filter = self.account_filter.currentText()
-        return [a for a in self.articles if (account_filter == "全部" or a.get('公众号', '') == account_filter) and (not search_text or search_text in a.get('标题', '').lower())]
+        """获取当前过滤后的文章列表（与表格显示顺序一致）"""
+        return self.table_model.visible_articles()
     
     def _on_context_menu(self, pos):
         """显示右键菜单"""
         # 获取点击位置的行
-        item = self.data_table.itemAt(pos)
-        if item is None:
+        index = self.data_table.indexAt(pos)
+        if not index.isValid():
             return
         
-        row = item.row()
+        row = index.row()
         if row < 0:
             return
         
-        # 获取当前过滤后的文章列表
-        filtered = self._get_filtered_articles()
-        if row >= len(filtered):
+        if row >= self.table_model.rowCount():
             return
         
-        article = filtered[row]
+        article = self.table_model.article(row)
         link = article.get('链接', '')
         
         # 创建右键菜单
@@ -403,7 +1259,7 @@ class ResultsPage(ScrollArea):
         # 在浏览器中打开
         if link:
             open_action = QAction("在浏览器中打开", self)
-            open_action.triggered.connect(lambda: QDesktopServices.openUrl(QUrl(link)))
+            open_action.triggered.connect(lambda: QDesktopServices.openUrl(_qurl(link)))
             menu.addAction(open_action)
         
         menu.addSeparator()
@@ -433,18 +1289,30 @@ class ResultsPage(ScrollArea):
         file_path, _ = QFileDialog.getSaveFileName(self, "导出文件", "", "CSV文件 (*.csv)")
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-                    if self.articles:
-                        writer = csv.DictWriter(f, fieldnames=self.articles[0].keys())
-                        writer.writeheader()
-                        writer.writerows(self.articles)
-                InfoBar.success(title="导出成功", content=f"数据已导出到 {file_path}", parent=self, position=InfoBarPosition.TOP, duration=3000)
+                saved_path = self.save_csv(file_path)
+                InfoBar.success(title="导出成功", content=f"数据已导出到 {saved_path}", parent=self, position=InfoBarPosition.TOP, duration=3000)
             except Exception as e:
                 InfoBar.error(title="导出失败", content=str(e), parent=self, position=InfoBarPosition.TOP, duration=3000)
     
+    def save_csv(self, file_path):
+        """
+        将当前全部文章保存为 CSV 文件（在调用线程中同步执行）
+        
+        与保存按钮导出 CSV 走同一写入路径，文章数超过 EXPORT_SEGMENT_SIZE 时
+        同样按段拆分为多个文件。
+        
+        Args:
+            file_path: 保存路径
+        
+        Returns:
+            str: 实际写入的文件路径（分段时为第一个分段文件）
+        """
+        if len(self.articles) > EXPORT_SEGMENT_SIZE:
+            return self._save_segmented(self._save_as_csv, file_path, self.articles)
+        self._save_as_csv(file_path, self.articles)
+        return file_path
+    
     def _on_open_folder(self):
-        # 导入默认输出目录
-        from gui.utils import DEFAULT_OUTPUT_DIR
         results_dir = os.path.abspath(DEFAULT_OUTPUT_DIR)
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
@@ -459,19 +1327,23 @@ class ResultsPage(ScrollArea):
             temp_file_path: 临时文件路径（爬取时自动保存的文件，用户放弃时需要删除）
         """
         # 转换数据格式以与 CSV 格式一致
+        # 五个字段由 itemgetter 一次取出，缺字段的文章再逐个取默认值
+        keys = ('name', 'title', 'publish_time', 'link', 'content')
+        get_fields = itemgetter(*keys)
         self.articles = []
-        accounts = set()
         for article in articles:
-            row = {
-                '公众号': article.get('name', ''),
-                '标题': article.get('title', ''),
-                '发布时间': article.get('publish_time', ''),
-                '链接': article.get('link', ''),
-                '内容': article.get('content', '')
-            }
-            self.articles.append(row)
-            if row['公众号']:
-                accounts.add(row['公众号'])
+            try:
+                name, title, publish_time, link, content = get_fields(article)
+            except KeyError:
+                name, title, publish_time, link, content = (article.get(k, '') for k in keys)
+            self.articles.append({
+                '公众号': name,
+                '标题': title,
+                '发布时间': publish_time,
+                '链接': link,
+                '内容': content
+            })
+        accounts = dict.fromkeys(row['公众号'] for row in self.articles if row['公众号'])
         
         # 更新状态
         self.current_file = None
@@ -480,13 +1352,10 @@ class ResultsPage(ScrollArea):
         self.temp_file_path = temp_file_path  # 保存临时文件路径
         
         # 更新公众号过滤器
-        self.account_filter.clear()
-        self.account_filter.addItem("全部")
-        for account in sorted(accounts):
-            self.account_filter.addItem(account)
+        self._set_account_choices(accounts)
         
         # 显示数据
-        self._display_articles(self.articles)
+        self._display_articles()
         
         # 显示来源信息和操作按钮
         self.source_label.setText(f"数据来源: {source_info} | 共 {len(self.articles)} 条记录 (未保存)")
@@ -517,571 +1386,370 @@ class ResultsPage(ScrollArea):
             return
         
         # 生成默认文件名 - 根据公众号数量生成不同的文件名
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # 获取所有公众号名称
-        accounts = set()
-        for article in self.articles:
-            account_name = article.get('公众号', '')
-            if account_name:
-                accounts.add(account_name)
-        
-        if len(accounts) == 1:
-            # 单个公众号：公众号名_时间戳
-            account_name = list(accounts)[0]
-            # 清理文件名中的非法字符
-            safe_name = "".join(c for c in account_name if c not in r'\/:*?"<>|')
-            base_name = f"{safe_name}_{timestamp}"
-        elif len(accounts) > 1:
-            # 多个公众号：批量爬取_N个公众号_时间戳
-            base_name = f"批量爬取_{len(accounts)}个公众号_{timestamp}"
-        else:
-            # 无公众号信息时使用默认名称
-            base_name = f"爬取结果_{timestamp}"
-        
-        # 构建文件过滤器字符串
-        filter_parts = []
-        for fmt_key, (fmt_name, fmt_ext) in SUPPORTED_FORMATS.items():
-            filter_parts.append(f"{fmt_name} (*{fmt_ext})")
-        filter_str = ";;".join(filter_parts)
-        
-        # 默认使用CSV格式，保存到用户目录下的 WeChatSpider 文件夹
-        default_name = os.path.join(DEFAULT_OUTPUT_DIR, f"{base_name}.csv")
-        
-        file_path, selected_filter = QFileDialog.getSaveFileName(
-            self, "保存结果", default_name, filter_str
-        )
-        
-        if file_path:
-            try:
-                # 确保目录存在
-                os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-                
-                # 根据文件扩展名确定保存格式
-                _, ext = os.path.splitext(file_path)
-                ext = ext.lower()
-                
-                if ext == '.csv':
-                    self._save_as_csv(file_path)
-                elif ext == '.json':
-                    self._save_as_json(file_path)
-                elif ext == '.xlsx':
-                    self._save_as_excel(file_path)
-                elif ext == '.md':
-                    self._save_as_markdown(file_path)
-                elif ext == '.html':
-                    self._save_as_html(file_path)
-                else:
-                    # 默认保存为CSV
-                    if not ext:
-                        file_path += '.csv'
-                    self._save_as_csv(file_path)
-                
-                # 保存成功后，删除临时文件（避免重复文件）
-                self._delete_temp_file()
-                
-                # 更新状态
-                self.current_file = file_path
-                self.is_unsaved = False
-                self.temp_file_path = None  # 清除临时文件路径
-                self.source_label.setText(f"数据来源: {self.source_info} | 已保存到 {os.path.basename(file_path)}")
-                self.save_btn.hide()
-                self.discard_btn.hide()
-                
-                # 刷新最近文件列表
-                self._update_recent_files()
-                
-                InfoBar.success(
-                    title="保存成功",
-                    content=f"数据已保存到 {file_path}",
-                    parent=self,
-                    position=InfoBarPosition.TOP,
-                    duration=3000
-                )
-            except Exception as e:
-                InfoBar.error(
-                    title="保存失败",
-                    content=str(e),
-                    parent=self,
-                    position=InfoBarPosition.TOP,
-                    duration=3000
-                )
-    
-    def _save_as_csv(self, file_path):
-        """
-        保存为 CSV 格式
-        
-        使用 utf-8-sig 编码，确保 Excel 能正确识别中文。
-        
-        Args:
-            file_path: 保存路径
-        """
-        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-            if self.articles:
-                writer = csv.DictWriter(f, fieldnames=self.articles[0].keys())
-                writer.writeheader()
-                writer.writerows(self.articles)
-    
-    def _save_as_json(self, file_path):
-        """保存为JSON格式"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(self.articles, f, ensure_ascii=False, indent=2)
-    
-    def _save_as_excel(self, file_path):
-        """保存为Excel格式"""
-        try:
-            import pandas as pd
-            df = pd.DataFrame(self.articles)
-            df.to_excel(file_path, index=False, engine='openpyxl')
-        except ImportError:
-            raise ImportError("保存Excel格式需要安装 pandas 和 openpyxl 库。\n请运行: pip install pandas openpyxl")
-    
-    def _save_as_markdown(self, file_path):
-        """
-        保存为 Markdown 格式
-        
-        生成结构化的 Markdown 文档，包含文章列表和内容。
-        
-        Args:
-            file_path: 保存路径
-        """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("# 微信公众号文章爬取结果\n\n")
-            f.write(f"共 {len(self.articles)} 篇文章\n\n")
-            f.write("---\n\n")
-            
-            for i, article in enumerate(self.articles, 1):
-                f.write(f"## {i}. {article.get('标题', '无标题')}\n\n")
-                f.write(f"- **公众号**: {article.get('公众号', '未知')}\n")
-                f.write(f"- **发布时间**: {article.get('发布时间', '未知')}\n")
-                link = article.get('链接', '')
-                if link:
-                    f.write(f"- **链接**: [{link}]({link})\n")
-                f.write("\n")
-                
-                content = article.get('内容', '')
-                if content:
-                    f.write("### 内容\n\n")
-                    f.write(content)
-                    f.write("\n\n")
-                
-                f.write("---\n\n")
-    
-    def _save_as_html(self, file_path):
-        """保存为HTML格式 - 单篇文章显示，支持左右切换"""
-        # 准备文章数据为JSON格式嵌入HTML
-        articles_json = []
-        for i, article in enumerate(self.articles):
-            articles_json.append({
-                'index': i + 1,
-                'title': self._escape_html(article.get('标题', '无标题')),
-                'account': self._escape_html(article.get('公众号', '未知')),
-                'pub_time': self._escape_html(article.get('发布时间', '未知')),
-                'link': article.get('链接', ''),
-                'content': self._markdown_to_html(article.get('内容', ''))
-            })
-        
-        # 将文章数据转换为JSON字符串
-        import json
-        articles_data = json.dumps(articles_json, ensure_ascii=False)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("""<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>微信公众号文章爬取结果</title>
-    <style>
-        * { box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            margin: 0;
-            padding: 0;
-            background: #f5f5f5;
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-        
-        /* 顶部导航栏 */
-        .header {
-            background: linear-gradient(135deg, #07c160 0%, #05a14e 100%);
-            color: white;
-            padding: 15px 20px;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-        }
-        .header h1 {
-            margin: 0 0 10px 0;
-            font-size: 20px;
-            font-weight: 600;
-        }
-        .nav-controls {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-            flex-wrap: wrap;
-        }
-        .nav-btn {
-            background: rgba(255,255,255,0.2);
-            border: none;
-            color: white;
-            padding: 8px 20px;
-            border-radius: 20px;
-            cursor: pointer;
-            font-size: 14px;
-            transition: all 0.3s;
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-        .nav-btn:hover:not(:disabled) {
-            background: rgba(255,255,255,0.3);
-            transform: translateY(-1px);
-        }
-        .nav-btn:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-        }
-        .page-info {
-            background: rgba(255,255,255,0.2);
-            padding: 8px 15px;
-            border-radius: 20px;
-            font-size: 14px;
-        }
-        .article-select {
-            padding: 8px 12px;
-            border-radius: 20px;
-            border: none;
-            background: rgba(255,255,255,0.9);
-            color: #333;
-            font-size: 14px;
-            max-width: 300px;
-            cursor: pointer;
-        }
-        
-        /* 文章容器 */
-        .article-container {
-            flex: 1;
-            max-width: 900px;
-            margin: 20px auto;
-            padding: 0 20px;
-            width: 100%;
-        }
-        .article {
-            background: white;
-            border-radius: 12px;
-            padding: 30px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-            animation: fadeIn 0.3s ease;
-        }
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        .article h2 {
-            color: #07c160;
-            margin: 0 0 20px 0;
-            font-size: 24px;
-            line-height: 1.4;
-        }
-        .meta {
-            color: #666;
-            font-size: 14px;
-            margin-bottom: 25px;
-            padding-bottom: 15px;
-            border-bottom: 1px solid #eee;
-            display: flex;
-            flex-wrap: wrap;
-            gap: 15px;
-        }
-        .meta-item {
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-        .content {
-            line-height: 1.9;
-            color: #333;
-            font-size: 16px;
-        }
-        .content img {
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            margin: 15px 0;
-        }
-        .content p {
-            margin: 0 0 15px 0;
-        }
-        .content a {
-            color: #07c160;
-            text-decoration: none;
-        }
-        .content a:hover {
-            text-decoration: underline;
-        }
-        .no-content {
-            color: #999;
-            font-style: italic;
-            text-align: center;
-            padding: 40px;
-        }
-        
-        /* 底部导航 */
-        .footer-nav {
-            background: white;
-            padding: 15px 20px;
-            display: flex;
-            justify-content: center;
-            gap: 20px;
-            box-shadow: 0 -2px 10px rgba(0,0,0,0.05);
-        }
-        .footer-btn {
-            background: #07c160;
-            border: none;
-            color: white;
-            padding: 12px 30px;
-            border-radius: 25px;
-            cursor: pointer;
-            font-size: 15px;
-            transition: all 0.3s;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        .footer-btn:hover:not(:disabled) {
-            background: #05a14e;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 15px rgba(7,193,96,0.3);
-        }
-        .footer-btn:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-        }
+        # 所有公众号名称（复用加载时整理好的下拉框选项）
+        accounts = [a for a in self._account_choices if a]
         
-        /* 键盘快捷键提示 */
-        .keyboard-hint {
-            text-align: center;
-            color: #999;
-            font-size: 12px;
-            padding: 10px;
-            background: #f9f9f9;
-        }
-        .keyboard-hint kbd {
-            background: #eee;
-            padding: 2px 8px;
-            border-radius: 4px;
-            border: 1px solid #ddd;
-            font-family: monospace;
-        }
+        if len(accounts) == 1:
+            # 单个公众号：公众号名_时间戳
+            account_name = accounts[0]
+            # 清理文件名中的非法字符
+            safe_name = account_name.translate(FILENAME_BAD_CHARS)
+            base_name = f"{safe_name}_{timestamp}"
+        elif len(accounts) > 1:
+            # 多个公众号：批量爬取_N个公众号_时间戳
+            base_name = f"批量爬取_{len(accounts)}个公众号_{timestamp}"
+        else:
+            # 无公众号信息时使用默认名称
+            base_name = f"爬取结果_{timestamp}"
         
-        /* 响应式设计 */
-        @media (max-width: 768px) {
-            .header h1 { font-size: 18px; }
-            .nav-controls { gap: 10px; }
-            .nav-btn { padding: 6px 15px; font-size: 13px; }
-            .article { padding: 20px; }
-            .article h2 { font-size: 20px; }
-            .content { font-size: 15px; }
-            .article-select { max-width: 200px; }
+        # 构建文件过滤器字符串
+        filter_parts = []
+        for fmt_key, (fmt_name, fmt_ext) in SUPPORTED_FORMATS.items():
+            filter_parts.append(f"{fmt_name} (*{fmt_ext})")
+        filter_str = ";;".join(filter_parts)
+        
+        # 默认使用CSV格式，保存到用户目录下的 WeChatSpider 文件夹
+        default_name = os.path.join(DEFAULT_OUTPUT_DIR, f"{base_name}.csv")
+        
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "保存结果", default_name, filter_str
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            # 确保目录存在
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        except Exception as e:
+            InfoBar.error(title="保存失败", content=str(e), parent=self, position=InfoBarPosition.TOP, duration=3000)
+            return
+        
+        # 根据文件扩展名确定保存格式
+        _, ext = os.path.splitext(file_path)
+        ext = ext.lower()
+        exporters = {
+            '.csv': self._save_as_csv,
+            '.json': self._save_as_json,
+            '.xlsx': self._save_as_excel,
+            '.md': self._save_as_markdown,
+            '.html': self._save_as_html,
         }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>📚 微信公众号文章爬取结果</h1>
-        <div class="nav-controls">
-            <button class="nav-btn" id="prevBtn" onclick="prevArticle()">
-                ◀ 上一篇
-            </button>
-            <span class="page-info" id="pageInfo">1 / """ + str(len(self.articles)) + """</span>
-            <button class="nav-btn" id="nextBtn" onclick="nextArticle()">
-                下一篇 ▶
-            </button>
-            <select class="article-select" id="articleSelect" onchange="goToArticle(this.value)">
-            </select>
-        </div>
-    </div>
+        export_func = exporters.get(ext)
+        if export_func is None:
+            # 默认保存为CSV
+            if not ext:
+                file_path += '.csv'
+            export_func = self._save_as_csv
+        
+        # 数据量超过单文件上限时，CSV/Excel 按段拆分为多个文件
+        if len(self.articles) > EXPORT_SEGMENT_SIZE and export_func in (self._save_as_csv, self._save_as_excel):
+            export_func = partial(self._save_segmented, export_func)
+        
+        # 在线程池中导出，完成后再更新页面状态
+        worker = _ExportWorker(export_func, file_path, self.articles)
+        worker.signals.progress.connect(self._on_export_progress)
+        worker.signals.finished.connect(self._on_export_finished)
+        worker.signals.failed.connect(self._on_export_failed)
+        self._export_worker = worker
+        self._set_exporting(True)
+        QThreadPool.globalInstance().start(worker)
     
-    <div class="article-container">
-        <div class="article" id="articleContent">
-            <!-- 文章内容将通过JavaScript动态填充 -->
-        </div>
-    </div>
+    def _set_exporting(self, exporting):
+        """切换导出中状态：禁用保存/放弃按钮并显示进度条"""
+        self.save_btn.setEnabled(not exporting)
+        self.discard_btn.setEnabled(not exporting)
+        self.export_progress.setValue(0)
+        self.export_progress.setVisible(exporting)
     
-    <div class="footer-nav">
-        <button class="footer-btn" id="footerPrevBtn" onclick="prevArticle()">
-            ◀ 上一篇
-        </button>
-        <button class="footer-btn" id="footerNextBtn" onclick="nextArticle()">
-            下一篇 ▶
-        </button>
-    </div>
+    def _on_export_progress(self, current, total):
+        """导出进度更新"""
+        self.export_progress.setMaximum(total)
+        self.export_progress.setValue(current)
     
-    <div class="keyboard-hint">
-        💡 快捷键: <kbd>←</kbd> 上一篇 | <kbd>→</kbd> 下一篇 | <kbd>Home</kbd> 第一篇 | <kbd>End</kbd> 最后一篇
-    </div>
-
-    <script>
-        // 文章数据
-        const articles = """ + articles_data + """;
-        let currentIndex = 0;
-        
-        // 初始化
-        function init() {
-            // 填充下拉选择框
-            const select = document.getElementById('articleSelect');
-            articles.forEach((article, index) => {
-                const option = document.createElement('option');
-                option.value = index;
-                option.textContent = `${article.index}. ${article.title.substring(0, 30)}${article.title.length > 30 ? '...' : ''}`;
-                select.appendChild(option);
-            });
+    def _on_export_finished(self, result):
+        """导出完成：删除临时文件并更新保存状态"""
+        file_path, articles = result
+        self._export_worker = None
+        self._set_exporting(False)
+        
+        # 导出期间页面已切换到其他数据时，只提示结果，不改动当前数据的状态
+        if articles is self.articles:
+            # 保存成功后，删除临时文件（避免重复文件）
+            self._delete_temp_file()
             
-            // 显示第一篇文章
-            showArticle(0);
-        }
+            # 更新状态
+            self.current_file = file_path
+            self.is_unsaved = False
+            self.temp_file_path = None  # 清除临时文件路径
+            self.source_label.setText(f"数据来源: {self.source_info} | 已保存到 {os.path.basename(file_path)}")
+            self.save_btn.hide()
+            self.discard_btn.hide()
         
-        // 显示指定文章
-        function showArticle(index) {
-            if (index < 0 || index >= articles.length) return;
-            
-            currentIndex = index;
-            const article = articles[index];
-            
-            // 更新文章内容
-            const container = document.getElementById('articleContent');
-            let linkHtml = '';
-            if (article.link) {
-                linkHtml = `<span class="meta-item">🔗 <a href="${article.link}" target="_blank">原文链接</a></span>`;
-            }
-            
-            let contentHtml = article.content || '<div class="no-content">暂无内容</div>';
-            
-            container.innerHTML = `
-                <h2>${article.index}. ${article.title}</h2>
-                <div class="meta">
-                    <span class="meta-item">📱 公众号: ${article.account}</span>
-                    <span class="meta-item">📅 发布时间: ${article.pub_time}</span>
-                    ${linkHtml}
-                </div>
-                <div class="content">${contentHtml}</div>
-            `;
-            
-            // 更新页码信息
-            document.getElementById('pageInfo').textContent = `${index + 1} / ${articles.length}`;
-            
-            // 更新下拉选择框
-            document.getElementById('articleSelect').value = index;
-            
-            // 更新按钮状态
-            updateButtons();
-            
-            // 滚动到顶部
-            window.scrollTo({ top: 0, behavior: 'smooth' });
-        }
+        # 刷新最近文件列表
+        self._update_recent_files()
         
-        // 更新按钮状态
-        function updateButtons() {
-            const isFirst = currentIndex === 0;
-            const isLast = currentIndex === articles.length - 1;
-            
-            document.getElementById('prevBtn').disabled = isFirst;
-            document.getElementById('nextBtn').disabled = isLast;
-            document.getElementById('footerPrevBtn').disabled = isFirst;
-            document.getElementById('footerNextBtn').disabled = isLast;
-        }
+        content = f"数据已保存到 {file_path}"
+        duration = 3000
+        if file_path.lower().endswith('.html') and len(articles) > HTML_PAGE_SIZE:
+            # 分页导出的文章数据在同目录的文件夹中，移动或分享页面时需要一并带上
+            content += f"\n文章数据保存在同目录的 {_html_page_dir(file_path)} 文件夹中，移动或分享时请一并带上"
+            duration = 6000
+        InfoBar.success(
+            title="保存成功",
+            content=content,
+            parent=self,
+            position=InfoBarPosition.TOP,
+            duration=duration
+        )
+    
+    def _on_export_failed(self, error):
+        """导出失败"""
+        self._export_worker = None
+        self._set_exporting(False)
+        InfoBar.error(
+            title="保存失败",
+            content=error,
+            parent=self,
+            position=InfoBarPosition.TOP,
+            duration=3000
+        )
+    
+    def _save_segmented(self, export_func, file_path, articles, progress_callback=None):
+        """
+        分段导出
         
-        // 上一篇
-        function prevArticle() {
-            if (currentIndex > 0) {
-                showArticle(currentIndex - 1);
-            }
-        }
+        每 EXPORT_SEGMENT_SIZE 篇文章写入一个文件，文件名依次为
+        name_1.ext、name_2.ext …，进度按全部文章累计回报。
         
-        // 下一篇
-        function nextArticle() {
-            if (currentIndex < articles.length - 1) {
-                showArticle(currentIndex + 1);
-            }
-        }
+        Args:
+            export_func: 单个文件的导出函数
+            file_path: 用户选择的保存路径
+            articles: 要保存的文章列表
+            progress_callback: 进度回调 (已处理数, 总数)，可为 None
         
-        // 跳转到指定文章
-        function goToArticle(index) {
-            showArticle(parseInt(index));
-        }
+        Returns:
+            第一个分段文件的路径
+        """
+        stem, ext = os.path.splitext(file_path)
+        total = len(articles)
+        for part, start in enumerate(range(0, total, EXPORT_SEGMENT_SIZE), 1):
+            callback = partial(_offset_progress, progress_callback, start, total) if progress_callback else None
+            export_func(f"{stem}_{part}{ext}", articles[start:start + EXPORT_SEGMENT_SIZE], callback)
+        return f"{stem}_1{ext}"
+    
+    def _save_as_csv(self, file_path, articles, progress_callback=None):
+        """
+        保存为 CSV 格式
         
-        // 键盘快捷键
-        document.addEventListener('keydown', function(e) {
-            // 如果焦点在输入框或选择框中，不处理快捷键
-            if (e.target.tagName === 'INPUT' || e.target.tagName === 'SELECT' || e.target.tagName === 'TEXTAREA') {
-                return;
-            }
+        使用 utf-8-sig 编码，确保 Excel 能正确识别中文。
+        
+        Args:
+            file_path: 保存路径
+            articles: 要保存的文章列表
+            progress_callback: 进度回调 (已处理数, 总数)，可为 None
+        """
+        with open(file_path, 'w', encoding='utf-8-sig', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+            if articles:
+                # 按固定的键顺序直接生成行列表，省去 DictWriter 逐行的字典检查
+                keys = list(articles[0].keys())
+                writer = csv.writer(f)
+                writer.writerow(keys)
+                writer.writerows([article.get(k, '') for k in keys]
+                                 for article in _iter_progress(articles, progress_callback))
+    
+    def _save_as_json(self, file_path, articles, progress_callback=None):
+        """
+        保存为JSON格式
+        
+        逐篇序列化并写入，不在内存中拼出整个 JSON 文本，
+        输出与 json.dump(indent=2) 完全一致。安装了 orjson 时
+        直接以二进制写入其 UTF-8 输出，省去一次编码。
+        """
+        if orjson is not None:
+            # 从 CSV 加载的行字段多于表头时，多余的值保存在 None 键下
+            # （见 _read_csv_articles），需要 OPT_NON_STR_KEYS
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                f.write(b'[')
+                for i, article in enumerate(_iter_progress(articles, progress_callback)):
+                    f.write(b',\n  ' if i else b'\n  ')
+                    f.write(orjson.dumps(article, option=option).replace(b'\n', b'\n  '))
+                f.write(b'\n]' if articles else b']')
+            return
+        
+        with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write('[')
+            for i, article in enumerate(_iter_progress(articles, progress_callback)):
+                f.write(',\n  ' if i else '\n  ')
+                # JSON 字符串中的换行已被转义，这里的 \n 只会是缩进换行
+                f.write(json.dumps(article, ensure_ascii=False, indent=2).replace('\n', '\n  '))
+            f.write('\n]' if articles else ']')
+    
+    def _save_as_excel(self, file_path, articles, progress_callback=None):
+        """
+        保存为Excel格式
+        
+        安装了 xlsxwriter 时直接以常量内存模式逐行写出：每写完一行就
+        刷到临时文件，内存占用与文章数量无关。未安装时回退到
+        openpyxl 的只写模式。
+        """
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+        
+        if xlsxwriter is not None:
+            keys = list(articles[0].keys()) if articles else []
+            # 关闭字符串自动识别，标题以 = 开头或内容是链接时仍按文本写入
+            workbook = xlsxwriter.Workbook(file_path, {
+                'constant_memory': True,
+                'strings_to_formulas': False,
+                'strings_to_urls': False,
+                'strings_to_numbers': False,
+            })
+            try:
+                sheet = workbook.add_worksheet()
+                sheet.write_row(0, 0, keys)
+                # 常量内存模式要求按行号从小到大依次写入
+                for row, article in enumerate(_iter_progress(articles, progress_callback), 1):
+                    sheet.write_row(row, 0, [article.get(k, '') for k in keys])
+            finally:
+                workbook.close()
+            return
+        
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+        except ImportError:
+            raise ImportError("保存Excel格式需要安装 xlsxwriter 或 openpyxl 库。\n请运行: pip install xlsxwriter")
+        
+        # openpyxl 只写模式：逐行追加并序列化，不在内存中保留整张工作表
+        keys = list(articles[0].keys()) if articles else []
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        
+        def as_text(value):
+            # 以 = 开头的字符串会被 openpyxl 当作公式，显式标记为文本
+            if isinstance(value, str) and value.startswith('='):
+                value = WriteOnlyCell(sheet, value)
+                value.data_type = 's'
+            return value
+        
+        sheet.append(keys)
+        for article in _iter_progress(articles, progress_callback):
+            sheet.append([as_text(article.get(k, '')) for k in keys])
+        workbook.save(file_path)
+    
+    def _save_as_markdown(self, file_path, articles, progress_callback=None):
+        """
+        保存为 Markdown 格式
+        
+        生成结构化的 Markdown 文档，包含文章列表和内容。
+        
+        Args:
+            file_path: 保存路径
+            articles: 要保存的文章列表
+            progress_callback: 进度回调 (已处理数, 总数)，可为 None
+        """
+        with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write("# 微信公众号文章爬取结果\n\n")
+            f.write(f"共 {len(articles)} 篇文章\n\n")
+            f.write("---\n\n")
             
-            switch(e.key) {
-                case 'ArrowLeft':
-                    prevArticle();
-                    e.preventDefault();
-                    break;
-                case 'ArrowRight':
-                    nextArticle();
-                    e.preventDefault();
-                    break;
-                case 'Home':
-                    showArticle(0);
-                    e.preventDefault();
-                    break;
-                case 'End':
-                    showArticle(articles.length - 1);
-                    e.preventDefault();
-                    break;
-            }
-        });
+            def sections():
+                # 每篇文章拼成一段文本，由 writelines 依次写入缓冲区
+                for i, article in enumerate(_iter_progress(articles, progress_callback), 1):
+                    link = article.get('链接', '')
+                    content = article.get('内容', '')
+                    yield (
+                        f"## {i}. {article.get('标题', '无标题')}\n\n"
+                        f"- **公众号**: {article.get('公众号', '未知')}\n"
+                        f"- **发布时间**: {article.get('发布时间', '未知')}\n"
+                        + (f"- **链接**: [{link}]({link})\n" if link else "")
+                        + "\n"
+                        + (f"### 内容\n\n{content}\n\n" if content else "")
+                        + "---\n\n"
+                    )
+            
+            f.writelines(sections())
+    
+    def _save_as_html(self, file_path, articles, progress_callback=None):
+        """
+        保存为HTML格式 - 单篇文章显示，支持左右切换
         
-        // 页面加载完成后初始化
-        document.addEventListener('DOMContentLoaded', init);
-    </script>
-</body>
-</html>
-""")
+        文章数据以 JSON 数组嵌入页面脚本，逐篇转换并写入文件，
+        不在内存中拼出完整的数据和页面字符串。
+        
+        文章数超过 HTML_PAGE_SIZE 时按页拆分：页面中只保留标题列表，
+        各页数据写入同名 _files 目录下的 articles_N.js，浏览时按需加载，
+        页面打开速度不再随文章总数增长。
+        """
+        total = len(articles)
+        paged = total > HTML_PAGE_SIZE
+        base_dir = os.path.dirname(file_path)
+        page_dir = _html_page_dir(file_path)
+        
+        # 逐篇套用记录模板，每页的第一条记录前不加分隔符
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        escape = self._escape_html
+        to_html = self._markdown_to_html
+        # 整条记录统一做脚本安全处理，链接等未转义的字段也不会提前结束脚本元素
+        records = (
+            _script_safe(_HTML_ARTICLE_RECORD.format(
+                sep=',' if (i - 1) % HTML_PAGE_SIZE else '',
+                index=i,
+                title=encode(escape(article.get('标题', '无标题'))),
+                account=encode(escape(article.get('公众号', '未知'))),
+                pub_time=encode(escape(article.get('发布时间', '未知'))),
+                link=encode(article.get('链接', '')),
+                content=encode(to_html(article.get('内容', ''))),
+            ))
+            for i, article in enumerate(_iter_progress(articles, progress_callback), 1)
+        )
+        
+        with open(file_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write(_HTML_HEAD)
+            f.write(str(total))
+            f.write(_HTML_BODY)
+            f.write(f'        const total = {total};\n')
+            f.write(f'        const pageSize = {HTML_PAGE_SIZE};\n')
+            f.write(f'        const pageDir = {_script_safe(encode(page_dir))};\n')
+            # 下拉框只显示截断后的标题，截断在导出时完成
+            f.write('        const titles = [')
+            f.write(','.join(encode(escape(_short_title(article.get('标题', '无标题')))) for article in articles))
+            f.write('];\n')
+            f.write(_HTML_VIEWER_SCRIPT)
+            if not paged:
+                f.write('    <script id="articleData" type="application/json">[')
+                f.writelines(records)
+                f.write(']</script>\n')
+            f.write(_HTML_TAIL)
+        
+        if paged:
+            # 每页数据单独写成一个脚本文件，依次从同一个记录迭代器中取出
+            page_path = os.path.join(base_dir, page_dir)
+            os.makedirs(page_path, exist_ok=True)
+            for page in range((total + HTML_PAGE_SIZE - 1) // HTML_PAGE_SIZE):
+                with open(os.path.join(page_path, f'articles_{page}.js'), 'w',
+                          encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(f'loadArticlePage({page}, [')
+                    f.writelines(islice(records, HTML_PAGE_SIZE))
+                    f.write(']);\n')
     
     def _escape_html(self, text):
         """转义HTML特殊字符"""
         if not text:
             return ''
-        return (str(text)
-                .replace('&', '&amp;')
-                .replace('<', '&lt;')
-                .replace('>', '&gt;')
-                .replace('"', '&quot;')
-                .replace("'", '&#39;'))
+        return _escape_html_cached(str(text))
     
     def _markdown_to_html(self, md_text):
         """简单的Markdown到HTML转换"""
         if not md_text:
             return ''
-        
-        # 尝试使用markdown库
-        try:
-            import markdown
-            return markdown.markdown(md_text, extensions=['tables', 'fenced_code'])
-        except ImportError:
-            # 如果没有markdown库，进行简单转换
-            html = self._escape_html(md_text)
-            # 转换换行
-            html = html.replace('\n\n', '</p><p>')
-            html = html.replace('\n', '<br>')
-            # 转换图片
-            import re
-            html = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', r'<img src="\2" alt="\1">', html)
-            # 转换链接
-            html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
-            return f'<p>{html}</p>'
+        return _render_markdown(str(md_text))
     
     def _on_discard_data(self):
         """放弃未保存的数据"""
@@ -1114,11 +1782,14 @@ class ResultsPage(ScrollArea):
     
     def _delete_temp_file(self):
         """删除临时文件"""
-        if self.temp_file_path and os.path.exists(self.temp_file_path):
+        if self.temp_file_path:
+            # 直接删除，文件不存在时忽略，不必先检查是否存在
             try:
                 os.remove(self.temp_file_path)
                 # 刷新最近文件列表
                 self._update_recent_files()
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 # 删除失败时记录错误但不阻止操作
                 print(f"删除临时文件失败: {e}")
@@ -1136,12 +1807,14 @@ class ResultsPage(ScrollArea):
         self.temp_file_path = None  # 清除临时文件路径
         
         # 清空表格
-        self.data_table.setRowCount(0)
+        self._titles_lower = []
+        self._accounts = []
+        self._by_account = {}
+        self.table_model.set_articles(self.articles)
         self.count_label.setText("共 0 条记录")
         
         # 清空过滤器
-        self.account_filter.clear()
-        self.account_filter.addItem("全部")
+        self._set_account_choices(())
         
         # 隐藏来源卡片和按钮
         self.source_card.hide()
@@ -36,7 +36,13 @@ from qfluentwidgets import (
 
 from ..styles import COLORS
 from ..widgets import CustomSpinBox
-from ..utils import DEFAULT_OUTPUT_DIR
+from ..utils import DEFAULT_OUTPUT_DIR, read_config, invalidate_config_cache
+
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================
 # 配置常量定义
@@ -325,28 +331,39 @@ class SettingsPage(ScrollArea):
         layout.addWidget(line)
     
     def _load_config(self):
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    self.config.update(json.load(f))
-            except Exception:
-                pass
+        # 与爬取页面共用按修改时间缓存的解析结果
+        self.config.update(read_config(CONFIG_FILE))
     
     def _save_config(self):
         """
         保存配置到文件
         
-        将当前配置写入 config.json 文件。
+        将当前配置写入 config.json 文件。先写入临时文件再整体替换，
+        其他页面读取配置时不会读到只写了一半的文件。
         
         Returns:
             bool: 保存成功返回 True，失败返回 False
         """
+        tmp_file = CONFIG_FILE + '.tmp'
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                # 输出格式与 json.dump(ensure_ascii=False, indent=2) 相同
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, CONFIG_FILE)
             return True
         except Exception:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             return False
+        finally:
+            # 配置文件已改写，丢弃缓存的旧配置
+            invalidate_config_cache()
     
     def _on_save(self):
         """
@@ -31,11 +31,11 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QHeaderView, QFileDialog, QTableWidgetItem,
     QGridLayout, QFrame
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
-from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt, QDate, QTimer, QSignalBlocker, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor
+from collections import ChainMap
 from datetime import datetime
 import os
-import json
 
 from qfluentwidgets import (
     TitleLabel, BodyLabel, CaptionLabel, CardWidget,
@@ -48,7 +48,7 @@ from qfluentwidgets import TableWidget as FluentTable
 from ..styles import COLORS
 from ..widgets import CardWidget as CustomCard, ProgressWidget, AccountListWidget, CustomSpinBox
 from ..workers import AsyncBatchScrapeWorker
-from ..utils import DEFAULT_OUTPUT_DIR, play_sound
+from ..utils import DEFAULT_OUTPUT_DIR, FILENAME_BAD_CHARS, play_sound, read_config
 from spider.wechat.scraper import AsyncBatchWeChatScraper
 
 # ============================================================
@@ -77,10 +77,15 @@ class NumericMonthFormatter(PickerColumnFormatter):
     qfluentwidgets 的 DatePicker 默认显示英文月份名（January, February...），
     这个格式化器将其改为显示数字（1, 2, 3...），更符合中文用户习惯。
     
+    格式化器不保存状态，同一页面的多个 DatePicker 可共用一个实例。
+    
     使用方式：
         date_picker.setColumnFormatter(0, NumericMonthFormatter())
     """
     
+    # 1-12 月的显示字符串，预先生成，滚动选择器重绘时不再逐次转换
+    _MONTH_TEXT = {month: str(month) for month in range(1, 13)}
+    
     def encode(self, value):
         """
         编码：将月份数值转换为显示字符串
@@ -91,7 +96,7 @@ class NumericMonthFormatter(PickerColumnFormatter):
         Returns:
             str: 月份的字符串表示
         """
-        return str(value)
+        return self._MONTH_TEXT.get(value) or str(value)
     
     def decode(self, value: str):
         """
@@ -121,12 +126,18 @@ class UnifiedScrapePage(QWidget):
         login_manager: 登录管理器，用于获取登录凭证
         batch_scraper: 异步批量爬虫实例
         scrape_worker: 爬取工作线程
-        config: 当前配置字典
+        config: 当前配置（ChainMap，依次查找设置页面的修改、配置文件、默认值）
     """
     
     # 爬取完成信号，用于通知主窗口跳转到结果页面
     scrape_completed = pyqtSignal(list, str, str)
     
+    # 爬虫上报的状态码 -> 状态列显示文字
+    _STATUS_TEXT = {
+        'searching': '搜索中', 'fetching': '获取中', 'filtering': '过滤中',
+        'content': '获取内容', 'completed': '完成', 'error': '失败', 'processing': '处理中'
+    }
+    
     def __init__(self, login_manager, parent=None):
         """
         初始化爬取页面
@@ -147,14 +158,48 @@ class UnifiedScrapePage(QWidget):
         # 当前爬取任务的输出文件路径
         self._current_output_file = None
         
+        # 本次爬取的公众号列表及其在来源描述中的显示文字，开始爬取时记录
+        self._last_accounts = []
+        self._accounts_label = ""
+        
+        # 状态表格中公众号名 -> 行号，开始爬取时建立
+        self._row_by_account = {}
+        # 状态表格各行的单元格 (公众号, 状态, 详情)，再次爬取时复用
+        self._row_items = []
+        
+        # 合并同一轮事件循环内到达的账号状态：行号 -> (状态, 详情)，
+        # 每轮只刷新一次表格
+        self._pending_status = {}
+        self._status_flush = QTimer(self)
+        self._status_flush.setSingleShot(True)
+        self._status_flush.setInterval(0)
+        self._status_flush.timeout.connect(self._flush_account_status)
+        
+        # 合并高频的进度信号：只保留最新的进度 (当前值, 总值, 消息) 和状态文字，
+        # 每 50ms 最多刷新一次进度控件
+        self._pending_progress = None
+        self._pending_status_text = None
+        self._progress_flush = QTimer(self)
+        self._progress_flush.setSingleShot(True)
+        self._progress_flush.setInterval(50)
+        self._progress_flush.timeout.connect(self._flush_progress)
+        
+        # 状态列文字颜色，创建一次后重复使用，其余状态使用警告色
+        self._status_brushes = {
+            'completed': QBrush(QColor(COLORS['success'])),
+            'error': QBrush(QColor(COLORS['error'])),
+        }
+        self._default_status_brush = QBrush(QColor(COLORS['warning']))
+        
         # 设置对象名称，用于样式表选择器
         self.setObjectName("unifiedScrapePage")
         
         # 强制设置暗黑背景色
         self.setStyleSheet("background-color: #1a1a1a;")
         
-        # 加载配置：先使用默认值，再从文件覆盖
-        self.config = DEFAULT_CONFIG.copy()
+        # 加载配置：设置页面的修改优先，其次是配置文件，最后是默认值
+        # 配置文件的解析结果和默认值只引用不复制，修改只写入第一层
+        self.config = ChainMap({}, {}, DEFAULT_CONFIG)
         self._load_config()
         
         # 构建界面
@@ -321,8 +366,10 @@ class UnifiedScrapePage(QWidget):
         grid.addWidget(BodyLabel("日期范围"), 1, 0)
         date_container = QHBoxLayout()
         date_container.setSpacing(6)
+        # 起止日期选择器共用同一个月份格式化器
+        month_formatter = NumericMonthFormatter()
         self.start_date = DatePicker()
-        self.start_date.setColumnFormatter(0, NumericMonthFormatter())  # 月份使用数字格式
+        self.start_date.setColumnFormatter(0, month_formatter)  # 月份使用数字格式
         self.start_date.setColumnWidth(0, 50)  # 缩小月份列宽度
         self.start_date.setDate(QDate.currentDate().addDays(-30))
         date_container.addWidget(self.start_date)
@@ -331,7 +378,7 @@ class UnifiedScrapePage(QWidget):
         date_sep.setAlignment(Qt.AlignmentFlag.AlignCenter)
         date_container.addWidget(date_sep)
         self.end_date = DatePicker()
-        self.end_date.setColumnFormatter(0, NumericMonthFormatter())  # 月份使用数字格式
+        self.end_date.setColumnFormatter(0, month_formatter)  # 月份使用数字格式
         self.end_date.setColumnWidth(0, 50)  # 缩小月份列宽度
         self.end_date.setDate(QDate.currentDate())
         date_container.addWidget(self.end_date)
@@ -484,7 +531,7 @@ class UnifiedScrapePage(QWidget):
         if len(accounts) == 1:
             # 单个公众号：公众号名_时间戳.csv
             # 清理文件名中的非法字符
-            safe_name = "".join(c for c in accounts[0] if c not in r'\/:*?"<>|')
+            safe_name = accounts[0].translate(FILENAME_BAD_CHARS)
             output_file = os.path.join(output_dir, f"{safe_name}_{timestamp}.csv")
         else:
             # 多个公众号：批量爬取_N个公众号_时间戳.csv
@@ -509,9 +556,28 @@ class UnifiedScrapePage(QWidget):
             'max_concurrent_requests': self.concurrent_spin.value()
         }
         
-        # 初始化状态表格
+        # 初始化状态表格，同时记录每个公众号所在的行
+        # 填充期间暂停重绘和信号，全部单元格设置完后统一刷新一次
+        self._status_flush.stop()
+        self._pending_status = {}
+        self.status_table.setUpdatesEnabled(False)
+        self.status_table.blockSignals(True)
+        # 行数减少时多出的单元格随行一起被表格删除，不再保留引用
+        row_items = self._row_items
+        del row_items[len(accounts):]
         self.status_table.setRowCount(len(accounts))
+        self._row_by_account = {}
         for i, acc in enumerate(accounts):
+            self._row_by_account.setdefault(acc, i)
+            if i < len(row_items):
+                # 复用上次爬取的单元格，只重置文字和状态颜色
+                item0, item1, item2 = row_items[i]
+                item0.setText(acc)
+                item1.setText("等待中")
+                item1.setData(Qt.ItemDataRole.ForegroundRole, None)
+                item2.setText("")
+                continue
+            
             # 创建居中对齐的单元格
             item0 = QTableWidgetItem(acc)
             item0.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -524,6 +590,10 @@ class UnifiedScrapePage(QWidget):
             item2 = QTableWidgetItem("")
             item2.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.status_table.setItem(i, 2, item2)
+            row_items.append((item0, item1, item2))
+        self.status_table.blockSignals(False)
+        self.status_table.setUpdatesEnabled(True)
+        self.status_table.viewport().update()
         
         # 更新状态提示
         self.status_hint.setText(f"正在爬取 {len(accounts)} 个公众号...")
@@ -532,9 +602,17 @@ class UnifiedScrapePage(QWidget):
         # 显示进度和取消按钮
         self.progress_card.show()
         self.progress_widget.reset()
+        self._drop_pending_progress()
         self.start_btn.hide()
         self.cancel_btn.show()
         
+        # 记录本次爬取的公众号，完成或取消时直接使用，不再重新读取输入列表
+        self._last_accounts = accounts
+        if len(accounts) == 1:
+            self._accounts_label = accounts[0]
+        else:
+            self._accounts_label = ', '.join(accounts[:3]) + ('...' if len(accounts) > 3 else '')
+        
         # 初始化爬取状态
         self._total_accounts = len(accounts)
         self._current_account_index = 0
@@ -552,57 +630,92 @@ class UnifiedScrapePage(QWidget):
         self.scrape_worker.start()
     
     def _on_progress_update(self, current, total, message):
-        """更新进度显示"""
-        if total > 0:
-            # 真实百分比进度模式（获取正文内容时）
-            self.progress_widget.set_progress(current, total, message)
-            # 同时更新文章数量显示
-            self.progress_widget.update_article_count(self._article_count)
-        else:
-            # 文章数量模式 - 使用动画进度条
+        """更新进度显示（暂存，由定时器合并刷新）"""
+        if total <= 0:
             self._article_count = current
-            self.progress_widget.set_article_progress(current, message)
+        self._queue_progress((current, total, message))
     
     def _on_article_progress(self, article_count, message):
-        """更新文章进度"""
+        """更新文章进度（暂存，由定时器合并刷新）"""
         self._article_count = article_count
-        self.progress_widget.set_article_progress(article_count, message)
+        self._queue_progress((article_count, 0, message))
     
     def _on_status_update(self, message):
-        self.progress_widget.progress_label.setText(message)
+        self._pending_status_text = message
+        if not self._progress_flush.isActive():
+            self._progress_flush.start()
+    
+    def _queue_progress(self, progress):
+        """
+        暂存最新进度
+        
+        进度会覆盖进度文字，因此之前暂存的状态文字一并丢弃，
+        保证刷新后的显示与逐条处理时一致。
+        """
+        self._pending_progress = progress
+        self._pending_status_text = None
+        if not self._progress_flush.isActive():
+            self._progress_flush.start()
+    
+    def _flush_progress(self):
+        """将暂存的最新进度和状态文字写入进度控件"""
+        progress, self._pending_progress = self._pending_progress, None
+        message, self._pending_status_text = self._pending_status_text, None
+        if progress is not None:
+            current, total, progress_message = progress
+            if total > 0:
+                # 真实百分比进度模式（获取正文内容时）
+                self.progress_widget.set_progress(current, total, progress_message)
+                # 同时更新文章数量显示
+                self.progress_widget.update_article_count(self._article_count)
+            else:
+                # 文章数量模式 - 使用动画进度条
+                self.progress_widget.set_article_progress(current, progress_message)
+        if message is not None:
+            self.progress_widget.progress_label.setText(message)
+    
+    def _drop_pending_progress(self):
+        """丢弃尚未刷新的进度，避免覆盖完成、失败或取消后的显示"""
+        self._progress_flush.stop()
+        self._pending_progress = None
+        self._pending_status_text = None
     
     def _on_account_status(self, account_name, status, message):
         """更新账号爬取状态"""
-        status_map = {
-            'searching': '搜索中', 'fetching': '获取中', 'filtering': '过滤中',
-            'content': '获取内容', 'completed': '完成', 'error': '失败', 'processing': '处理中'
-        }
+        # 按公众号名直接取行号，不再逐行比对表格内容
+        row = self._row_by_account.get(account_name)
+        if row is None:
+            return
         
         # 更新当前账号索引
-        if status in ['searching', 'fetching']:
-            for row in range(self.status_table.rowCount()):
-                item = self.status_table.item(row, 0)
-                if item and item.text() == account_name:
-                    self._current_account_index = row + 1
-                    break
-        
-        for row in range(self.status_table.rowCount()):
-            item = self.status_table.item(row, 0)
-            if item and item.text() == account_name:
-                # 更新状态列
-                status_item = self.status_table.item(row, 1)
-                status_item.setText(status_map.get(status, status))
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                color = COLORS['success'] if status == 'completed' else COLORS['error'] if status == 'error' else COLORS['warning']
-                status_item.setForeground(QColor(color))
-                
-                # 更新详情列
-                detail_item = self.status_table.item(row, 2)
-                detail_item.setText(message)
-                detail_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                break
+        if status in ('searching', 'fetching'):
+            self._current_account_index = row + 1
+        
+        # 同一账号只保留最新状态，表格在本轮事件处理完后统一更新
+        self._pending_status[row] = (status, message)
+        if not self._status_flush.isActive():
+            self._status_flush.start()
+    
+    def _flush_account_status(self):
+        """将暂存的账号状态一次性写入状态表格"""
+        pending, self._pending_status = self._pending_status, {}
+        if not pending:
+            return
+        status_text = self._STATUS_TEXT
+        brushes = self._status_brushes
+        default_brush = self._default_status_brush
+        row_items = self._row_items
+        # 单元格创建时已设置居中对齐，这里只更新文字和颜色
+        self.status_table.setUpdatesEnabled(False)
+        for row, (status, message) in pending.items():
+            _, status_item, detail_item = row_items[row]
+            status_item.setText(status_text.get(status, status))
+            status_item.setForeground(brushes.get(status, default_brush))
+            detail_item.setText(message)
+        self.status_table.setUpdatesEnabled(True)
     
     def _on_scrape_success(self, articles, output_file):
+        self._drop_pending_progress()
         self.start_btn.show()
         self.cancel_btn.hide()
         self._article_count = len(articles)
@@ -615,22 +728,22 @@ class UnifiedScrapePage(QWidget):
         play_sound('complete')
         
         # 保存公众号到历史记录
-        accounts = self.account_list.get_accounts()
+        accounts = self._last_accounts
         if accounts:
             self.account_list.add_to_history(accounts)
         
         # 发射信号，跳转到结果页面，传递临时文件路径
         if len(accounts) == 1:
-            source_info = f"爬取: {accounts[0]}"
+            source_info = f"爬取: {self._accounts_label}"
         else:
-            accounts_str = ', '.join(accounts[:3]) + ('...' if len(accounts) > 3 else '')
-            source_info = f"批量爬取: {accounts_str} (共{len(accounts)}个公众号)"
+            source_info = f"批量爬取: {self._accounts_label} (共{len(accounts)}个公众号)"
         
         # 传递临时文件路径，以便用户放弃时可以删除
         temp_file = self._current_output_file or output_file
         self.scrape_completed.emit(articles, source_info, temp_file)
     
     def _on_scrape_failed(self, error_msg):
+        self._drop_pending_progress()
         self.start_btn.show()
         self.cancel_btn.hide()
         self.progress_card.hide()
@@ -648,6 +761,7 @@ class UnifiedScrapePage(QWidget):
             self.scrape_worker.cancel()
             self.scrape_worker = None
         
+        self._drop_pending_progress()
         self.start_btn.show()
         self.cancel_btn.hide()
         self.progress_widget.progress_label.setText("已取消")
@@ -656,24 +770,17 @@ class UnifiedScrapePage(QWidget):
         
         # 如果有已爬取的数据，也跳转到结果页面
         if articles_before_cancel:
-            accounts = self.account_list.get_accounts()
-            if len(accounts) == 1:
-                source_info = f"爬取(已取消): {accounts[0]}"
+            if len(self._last_accounts) == 1:
+                source_info = f"爬取(已取消): {self._accounts_label}"
             else:
-                accounts_str = ', '.join(accounts[:3]) + ('...' if len(accounts) > 3 else '')
-                source_info = f"批量爬取(已取消): {accounts_str}"
+                source_info = f"批量爬取(已取消): {self._accounts_label}"
             # 传递临时文件路径
             temp_file = self._current_output_file or ""
             self.scrape_completed.emit(articles_before_cancel, source_info, temp_file)
     
     def _load_config(self):
-        """从配置文件加载设置"""
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    self.config.update(json.load(f))
-            except Exception:
-                pass
+        """从配置文件加载设置（文件未变化时直接使用缓存的解析结果）"""
+        self.config.maps[1] = read_config(CONFIG_FILE)
     
     def _apply_config_to_ui(self):
         """将配置应用到UI控件"""
@@ -690,22 +797,25 @@ class UnifiedScrapePage(QWidget):
         # 更新本地配置
         self.config.update(config)
         
-        # 应用到UI控件
-        if 'max_pages' in config:
-            self.pages_spin.setValue(config['max_pages'])
-        
-        if 'request_interval' in config:
-            self.interval_spin.setValue(config['request_interval'])
-        
-        if 'max_workers' in config:
-            self.concurrent_spin.setValue(config['max_workers'])
+        # 应用到UI控件，设置期间屏蔽控件信号，避免逐项触发槽函数
+        with QSignalBlocker(self.pages_spin), QSignalBlocker(self.interval_spin), \
+                QSignalBlocker(self.concurrent_spin), QSignalBlocker(self.content_check):
+            if 'max_pages' in config:
+                self.pages_spin.setValue(config['max_pages'])
+            
+            if 'request_interval' in config:
+                self.interval_spin.setValue(config['request_interval'])
+            
+            if 'max_workers' in config:
+                self.concurrent_spin.setValue(config['max_workers'])
+            
+            if 'include_content' in config:
+                self.content_check.setChecked(config['include_content'])
         
         if 'include_content' in config:
-            self.content_check.setChecked(config['include_content'])
-            # 同时更新关键词过滤输入框的启用状态
-            self.keyword_filter_input.setEnabled(config['include_content'])
-            if not config['include_content']:
-                self.keyword_filter_input.clear()
+            # 复选框信号已屏蔽，这里同步一次关键词过滤输入框的启用状态
+            state = Qt.CheckState.Checked if config['include_content'] else Qt.CheckState.Unchecked
+            self._on_content_check_changed(state.value)
         
         if 'output_dir' in config:
             self.output_input.setText(config['output_dir'])
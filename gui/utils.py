@@ -12,6 +12,13 @@ GUI 工具函数模块
     - get_wechat_cache_file(): 获取微信缓存文件路径
     - get_account_history_file(): 获取公众号历史记录文件路径
 
+文件名处理:
+    - FILENAME_BAD_CHARS: 文件名非法字符删除表，配合 str.translate 使用
+
+配置文件:
+    - read_config(): 读取 config.json，按修改时间缓存解析结果
+    - invalidate_config_cache(): 配置文件改写后清空缓存
+
 音频播放:
     - SoundPlayer: 音频播放器单例类
     - get_sound_player(): 获取全局播放器实例
@@ -33,10 +40,18 @@ GUI 工具函数模块
 
 import os
 import sys
+import json
+import threading
 from pathlib import Path
 from PyQt6.QtCore import QUrl
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_default_output_dir() -> str:
     """获取默认输出目录
@@ -159,6 +174,60 @@ DEFAULT_OUTPUT_DIR = get_default_output_dir()
 WECHAT_CACHE_FILE = get_wechat_cache_file()
 ACCOUNT_HISTORY_FILE = get_account_history_file()
 
+# 文件名非法字符删除表（str.translate 在 C 层完成过滤），各页面生成文件名时共用
+FILENAME_BAD_CHARS = str.maketrans('', '', r'\/:*?"<>|')
+
+
+# ==================== 配置文件读取 ====================
+
+# 已解析的配置文件缓存：路径 -> (修改时间, 配置字典)
+# 文件未被改写时，各页面再次读取配置不必重新打开和解析文件
+_CONFIG_CACHE = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def read_config(path: str) -> dict:
+    """读取配置文件，按修改时间缓存解析结果
+    
+    爬取页面和设置页面共用此函数读取 config.json，
+    文件修改时间不变时直接返回上次解析的结果。
+    
+    Args:
+        path: 配置文件路径
+        
+    Returns:
+        dict: 配置字典（与缓存共享，调用方不应修改）；
+              文件不存在或解析失败时返回空字典
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            # 以字节读取，orjson 直接解析 UTF-8，省去文本解码
+            with open(path, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception:
+            return {}
+        if not isinstance(config, dict):
+            return {}
+        _CONFIG_CACHE[path] = (mtime, config)
+        return config
+
+
+def invalidate_config_cache():
+    """清空配置缓存
+    
+    配置文件被改写后（如设置页面保存时）调用，下次读取时重新解析。
+    """
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
 
 # ==================== 音频播放功能 ====================
 
@@ -610,6 +610,7 @@ class ArticlePreviewDialog(QDialog):
         super().__init__(parent)
         self.articles = []  # 文章列表
         self.current_index = 0  # 当前文章索引
+        self._shown_content = None  # 内容区当前显示的正文，用于跳过重复渲染
         self._setup_ui()
         self._setup_shortcuts()
     
@@ -812,6 +813,7 @@ class ArticlePreviewDialog(QDialog):
             self.account_label.setText("公众号: -")
             self.time_label.setText("发布时间: -")
             self.content_text.setText("")
+            self._shown_content = None
             self.count_label.setText("0 / 0")
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
@@ -833,9 +835,11 @@ class ArticlePreviewDialog(QDialog):
         pub_time = article.get('发布时间', '-')
         self.time_label.setText(f"📅 发布时间: {pub_time}")
         
-        # 更新内容
+        # 更新内容（正文未变时跳过 setText，重新打开同一篇文章无需再次解析排版）
         content = article.get('内容', '')
-        self.content_text.setText(content if content else "无内容")
+        if content is not self._shown_content:
+            self._shown_content = content
+            self.content_text.setText(content if content else "无内容")
         
         # 滚动到顶部
         self.content_text.verticalScrollBar().setValue(0)
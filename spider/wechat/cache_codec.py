@@ -483,6 +483,9 @@ def get_cache_info(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     获取缓存数据的摘要信息
     
+    只基于内存中的数据字典计算，不会重新读取或解码缓存文件，
+    可直接传入 decode_to_cache_file 的返回值。
+    
     Args:
         data: 缓存数据字典
         
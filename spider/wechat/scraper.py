@@ -1017,9 +1017,11 @@ class AsyncBatchWeChatScraper:
                                 async with lock:
                                     scraper_self.total_articles_count -= filtered_out
                                     # 更新已收集的文章列表（移除被过滤的）
+                                    # 过滤结果与已收集列表是同一批字典对象，按 id 建集合做 O(1) 成员判断
+                                    kept_ids = {id(a) for a in articles_in_range}
                                     scraper_self.collected_articles = [
                                         a for a in scraper_self.collected_articles
-                                        if a.get('name') != account_name or a in articles_in_range
+                                        if a.get('name') != account_name or id(a) in kept_ids
                                     ]
                                 
                                 self._trigger_article_progress(
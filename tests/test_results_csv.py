@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+结果页面 CSV 读取测试
+
+校验 _read_csv_articles 对字段数与表头不一致的行的处理与 csv.DictReader 相同，
+避免重新导出时丢失列。
+"""
+
+import csv
+
+import pytest
+
+results_page = pytest.importorskip("gui.pages.results_page")
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "articles.csv"
+    path.write_text(text, encoding="utf-8-sig")
+    return path
+
+
+def _load(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return results_page._read_csv_articles(f)
+
+
+def _load_with_dictreader(path):
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_short_row_keeps_all_header_keys(tmp_path):
+    """字段少于表头的行保留全部表头列，缺少的值为 None"""
+    path = _write(tmp_path, "公众号,标题,链接,内容\n甲,标题一\n乙,标题二,https://a,正文\n")
+    articles = _load(path)
+    assert articles[0] == {'公众号': '甲', '标题': '标题一', '链接': None, '内容': None}
+    assert list(articles[0].keys()) == ['公众号', '标题', '链接', '内容']
+    assert articles == _load_with_dictreader(path)
+
+
+def test_long_row_keeps_extra_fields(tmp_path):
+    """字段多于表头的行，多余的值保存在 None 键下"""
+    path = _write(tmp_path, "公众号,标题\n甲,标题一,多余1,多余2\n")
+    articles = _load(path)
+    assert articles == [{'公众号': '甲', '标题': '标题一', None: ['多余1', '多余2']}]
+    assert articles == _load_with_dictreader(path)
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    """空行不产生记录"""
+    path = _write(tmp_path, "公众号,标题\n\n甲,标题一\n\n")
+    assert _load(path) == [{'公众号': '甲', '标题': '标题一'}]